@@ -36,6 +36,12 @@ COLORS = {
 
 VALID_MAP_CHARS = set("#.@XABCDEFGHIJabcdefghij123456789")
 
+# ASCII-indexed lookup tables -- index with ord(char) instead of hashing into COLORS / VALID_MAP_CHARS
+COLOR_TABLE = [WHITE] * 128
+for _char, _color in COLORS.items():
+    COLOR_TABLE[ord(_char)] = _color
+del _char, _color
+
 BLANK_MAP = [
     "#####################",
     "#...................#",
@@ -59,5 +65,11 @@ BLANK_MAP = [
     "#####################",
 ]
 
+# Rows and columns of BLANK_MAP, used to size the window before any map is loaded
+BLANK_MAP_SHAPE = (len(BLANK_MAP), len(BLANK_MAP[0]))
+
+# BLANK_MAP in the same bytes-rows form as Round.board, used as the map component's data when no game is loaded
+BLANK_BOARD = tuple(row.encode("ascii") for row in BLANK_MAP)
+
 from .settings import AntSettings
 from .simulation import AntSimulation
@@ -1,4 +1,4 @@
 from .command import Command, CommandManager, HelpCommand, ConfigCommand
 from .component import Component
 from .message import Message
-from .round import Round
+from .round import Round, Rounds
@@ -1,14 +1,30 @@
 # Standard Library Imports
-from copy import deepcopy
+import bisect
+import functools
+import sys
+from itertools import zip_longest
 
 # Third-Party Imports
 import difflib
-from typing import Callable, Optional, Dict
+from typing import Any, Callable, Optional, Dict
 from colorama import Fore, Back, Style
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # Optional speedup; fall back to difflib
+    fuzz = process = None
+
 # Local Imports
 from .message import Message
 
+# Escape codes bound once, rather than looked up on colorama's classes for every f-string
+_DIM, _NORMAL, _BRIGHT = Style.DIM, Style.NORMAL, Style.BRIGHT
+_GREEN, _CYAN, _RESET = Fore.GREEN, Fore.CYAN, Fore.RESET
+_KEY_FMT = f"{_BRIGHT}>{_NORMAL} {_DIM}"
+
+# Builds the "config" message queued for the main thread: _config_msg((key, value))
+_config_msg = functools.partial(Message, "config")
+
 
 class Command:
     """
@@ -26,6 +42,14 @@ class Command:
             Executes the command's executor function and returns its result.
     """
 
+    __slots__ = (
+        "command",
+        "executor",
+        "short_description",
+        "long_description",
+        "aliases",
+    )
+
     def __init__(
         self,
         command: str,
@@ -43,7 +67,6 @@ class Command:
             long_description (str): A detailed description of the command.
             executor (Callable[[], bool]): The function to execute when the command is invoked.
             aliases (Optional[list[str]]): A list of alternative command strings (default is None).
-            is_alias (bool): Marks this command as an alias of another command.
         """
         self.command = command
         self.executor = executor
@@ -51,8 +74,6 @@ class Command:
         self.long_description = long_description
         self.aliases = aliases if aliases else []
 
-        self.is_alias = False
-
     def execute(self, args: Optional[list[str]] = None) -> bool:
         """
         Executes the command's executor function.
@@ -62,24 +83,14 @@ class Command:
         """
         return self.executor(args)
 
-    def alias_copy(self):
-        """
-        Returns a fully independent copy of this command instance with the `is_alias` flag enabled.
-
-        Returns:
-            Command: The `is_alias`-marked copy of this instance
-        """
-        command_alias = deepcopy(self)
-        command_alias.is_alias = True
-        return command_alias
-
 
 class CommandManager:
     """
     A class for managing a collection of commands in a console-based application.
 
     Attributes:
-        commands (Dict[str, Command]): A dictionary of commands where keys are command strings.
+        primary (Dict[str, Command]): A dictionary of commands keyed by their primary command strings.
+        aliases (Dict[str, Command]): A dictionary mapping alias strings to the command they refer to.
 
     Methods:
         register_command(command: Command) -> None:
@@ -88,20 +99,31 @@ class CommandManager:
         delete_command(command: str) -> None:
             Deletes a command by its string identifier.
 
+        get_command(command: str) -> Optional[Command]:
+            Looks up a command by its primary string or one of its aliases.
+
         execute_command(command: str) -> bool:
             Executes a command by its string identifier.
 
         help_command(command_str: Optional[str] = None) -> None:
             Displays help for all commands or a specific command.
+
+        get_help_listing() -> tuple[list[str], int]:
+            Returns the maintained, sorted list of primary command names and the help column width.
     """
 
     def __init__(self, simulation) -> None:
         """
         Initializes the CommandManager with an empty set of commands.
         """
-        self.commands: Dict[str, Command] = {}
+        self.primary: Dict[str, Command] = {}
+        self.aliases: Dict[str, Command] = {}
         self.simulation = simulation
 
+        # Primary (non-alias) command names kept in sorted order, plus the longest name length
+        self._primary_cmds: list[str] = []
+        self._max_cmd_len = 0
+
     def register_command(self, command: Command) -> None:
         """
         Registers a new command in the CommandManager.
@@ -112,12 +134,15 @@ class CommandManager:
         Raises:
             KeyError: If a command with the same string already exists.
         """
-        if command.command in self.commands:
-            raise KeyError(f"Command '{command.command}' already exists.")
-        self.commands[command.command] = command
-        if command.aliases:
-            for alias in command.aliases:
-                self.commands[alias] = command.alias_copy()
+        # Interned keys let lookups of interned input strings compare by identity
+        key = sys.intern(command.command)
+        if key in self.primary or key in self.aliases:
+            raise KeyError(f"Command '{key}' already exists.")
+        self.primary[key] = command
+        for alias in command.aliases:
+            self.aliases[sys.intern(alias)] = command
+        bisect.insort(self._primary_cmds, key)
+        self._max_cmd_len = max(self._max_cmd_len, len(key))
 
     def delete_command(self, command: str) -> None:
         """
@@ -129,9 +154,42 @@ class CommandManager:
         Raises:
             KeyError: If the command does not exist.
         """
-        if command not in self.commands:
+        if command in self.primary:
+            del self.primary[command]
+            del self._primary_cmds[bisect.bisect_left(self._primary_cmds, command)]
+            if len(command) == self._max_cmd_len:
+                self._max_cmd_len = max(map(len, self._primary_cmds), default=0)
+        elif command in self.aliases:
+            del self.aliases[command]
+        else:
             raise KeyError(f"Command '{command}' not found.")
-        del self.commands[command]
+
+    def get_help_listing(self) -> tuple[list[str], int]:
+        """
+        Returns the sorted list of primary (non-alias) command names along with the column width used by the help grid.
+
+        Both are maintained incrementally by `register_command` and `delete_command`, so no sorting happens here.
+
+        Returns:
+            tuple[list[str], int]: The sorted command names and the padded column width.
+        """
+        return self._primary_cmds, self._max_cmd_len + 5
+
+    def get_command(self, command: str) -> Optional[Command]:
+        """
+        Looks up a command by its primary string or one of its aliases.
+
+        Args:
+            command (str): The command or alias string to look up.
+
+        Returns:
+            Optional[Command]: The matching command, or None if there is none.
+        """
+        command = sys.intern(command)
+        found = self.primary.get(command)
+        if found is None:
+            found = self.aliases.get(command)
+        return found
 
     def execute_command(self, command: str, args: Optional[list[str]] = None) -> bool:
         """
@@ -146,9 +204,10 @@ class CommandManager:
         Raises:
             KeyError: If the command does not exist.
         """
-        if command not in self.commands:
+        found = self.get_command(command)
+        if found is None:
             raise KeyError(f"Command '{command}' not found.")
-        return self.commands[command].execute(args)
+        return found.execute(args)
 
 
 class HelpCommand(Command):
@@ -189,36 +248,31 @@ class HelpCommand(Command):
         it will display the long description and aliases.
         """
         if command_str:
-            if command_str in self.command_manager.commands:
-                command = self.command_manager.commands[command_str]
+            command = self.command_manager.get_command(command_str)
+            if command is not None:
                 print(
-                    f"{Style.DIM}{command.command}{Style.NORMAL} - {command.short_description}\n\n{command.long_description}"
+                    f"{_DIM}{command.command}{_NORMAL} - {command.short_description}\n\n{command.long_description}"
                 )
                 if command.aliases:
                     if command.long_description != "":
                         print()
                     print(
-                        f"Aliases: {Fore.GREEN}{', '.join('<ENTER>' if alias == '' and command.command == 'toggle' else alias for alias in command.aliases)}{Fore.RESET}"
+                        f"Aliases: {_GREEN}{', '.join('<ENTER>' if alias == '' and command.command == 'toggle' else alias for alias in command.aliases)}{_RESET}"
                     )
             else:
                 print(f"Command '{command_str}' not found.")
         else:
             print("Available commands\n")
             print(
-                f'Type {Style.DIM}"help [command]"{Style.NORMAL} to view help for a specific command\n'
+                f'Type {_DIM}"help [command]"{_NORMAL} to view help for a specific command\n'
             )
-            cmd_list = [
-                command.command
-                for command in self.command_manager.commands.values()
-                if not command.is_alias
-            ]
-            cmd_list.sort()
-            for i, string in enumerate(cmd_list):
-                print(
-                    string.ljust(max(map(len, cmd_list), default=0) + 5),
-                    end="\n" if (i + 1) % 2 == 0 else "",
-                )
-            print()
+            cmd_list, width = self.command_manager.get_help_listing()
+            it = iter(cmd_list)
+            rows = [f"{a:<{width}}{b}" for a, b in zip_longest(it, it, fillvalue="")]
+            if rows:
+                # With an odd number of commands the last row has only its padded first column
+                rows[-1] = rows[-1].rstrip()
+            sys.stdout.write("\n".join(rows) + "\n")
 
     def execute(self, args: Optional[list[str]] = None) -> bool:
         """
@@ -235,6 +289,69 @@ class HelpCommand(Command):
         return True
 
 
+_LITERALS = {"true": True, "false": False, "none": None}
+
+
+def _coerce(value: str) -> Any:
+    """
+    Convert a user-typed config value into its Python literal.
+
+    Booleans and None are resolved through a lookup table; numbers are parsed as a float
+    if they contain a decimal point and as an int otherwise. Anything else is returned as-is.
+
+    Args:
+        value (str): The raw value entered by the user.
+
+    Returns:
+        Any: The parsed bool, None, float, or int, or the original string.
+    """
+    lowered = value.lower()
+    if lowered in _LITERALS:
+        return _LITERALS[lowered]
+    try:
+        return float(value) if "." in value else int(value)
+    except ValueError:
+        return value
+
+
+@functools.lru_cache(maxsize=128)
+def _sorted_key_matches(
+    key_name: str, keys: tuple[str, ...]
+) -> tuple[tuple[str, float], ...]:
+    """
+    Rank the given setting keys by similarity to a key name.
+
+    Results are memoized on `(key_name, keys)`, so repeated lookups skip the quadratic
+    SequenceMatcher work, and a changed set of keys naturally produces a fresh entry.
+    If rapidfuzz is installed its native `fuzz.ratio` scorer is used instead of difflib,
+    with scores scaled to the same 0-1 range as `SequenceMatcher.ratio()`.
+
+    Args:
+        key_name (str): The input key name to compare against the keys.
+        keys (tuple[str, ...]): The setting keys to rank.
+
+    Returns:
+        tuple[tuple[str, float], ...]: Key names and similarity scores, best match first.
+    """
+    if process is not None:
+        return tuple(
+            (key, score / 100)
+            for key, score, _ in process.extract(
+                key_name, keys, scorer=fuzz.ratio, limit=None
+            )
+        )
+
+    matcher = difflib.SequenceMatcher(None, key_name, None)
+    similarity_scores = {}
+    for key in keys:
+        matcher.set_seq2(key)
+        similarity_scores[key] = matcher.ratio()
+
+    return tuple(
+        sorted(similarity_scores.items(), key=lambda item: item[1], reverse=True)
+    )
+
+
 class ConfigCommand(Command):
     def __init__(self, command_manager: CommandManager) -> None:
         super().__init__(
@@ -244,6 +361,24 @@ class ConfigCommand(Command):
             executor=self.execute,
         )
         self.command_manager = command_manager
+        self._key_info: Dict[str, tuple[str, str]] = {}
+
+    def get_key_info(self, key: str) -> tuple[str, str]:
+        """
+        Retrieve the type name and description of a configuration key, caching the result per key.
+
+        Args:
+            key (str): The configuration key to look up.
+
+        Returns:
+            tuple[str, str]: The key's type name and its description.
+        """
+        info = self._key_info.get(key)
+        if info is None:
+            settings = self.command_manager.simulation.settings
+            info = (settings.get_key_type(key), settings.get_key_description(key))
+            self._key_info[key] = info
+        return info
 
     def get_sorted_key_matches(self, key_name: str) -> list[tuple[str, float]]:
         """
@@ -255,25 +390,19 @@ class ConfigCommand(Command):
         Returns:
             list[tuple[str, float]]: A list of tuples containing key names and their similarity scores.
         """
-        keys = list(self.command_manager.simulation.settings.data.keys())
+        keys = tuple(self.command_manager.simulation.settings.data.keys())
 
-        similarity_scores = {
-            key: difflib.SequenceMatcher(None, key_name, key).ratio() for key in keys
-        }
-
-        sorted_keys_with_scores = sorted(
-            similarity_scores.items(), key=lambda item: item[1], reverse=True
-        )
-
-        return sorted_keys_with_scores
+        return list(_sorted_key_matches(key_name, keys))
 
     def get_best_match_key(self, key_name: str) -> str:
         """
         Retrieve the best-matching configuration key based on similarity to the provided input.
 
-        This function uses a scoring mechanism to determine the similarity between the given key name
-        and the available configuration keys. If no suitable match is found, it provides feedback
-        to the user and returns `False`.
+        An exact key (compared case-insensitively, since console input is lowercased) or a prefix
+        shared by exactly one key is returned immediately. Otherwise this function uses a scoring
+        mechanism to determine the similarity between the given key name and the available
+        configuration keys. If no suitable match is found, it provides feedback to the user and
+        returns `False`.
 
         Args:
             key_name (str): The name of the key to search for.
@@ -282,6 +411,21 @@ class ConfigCommand(Command):
             str: The best-matching key name if a good match is found.
             bool: Returns `False` if no matches or no sufficiently good match is found.
         """
+        keys = self.command_manager.simulation.settings.data
+        if key_name in keys:
+            return key_name
+
+        lowered = key_name.lower()
+        prefix_hits = []
+        for key in keys:
+            lowered_key = key.lower()
+            if lowered_key == lowered:
+                return key
+            if lowered_key.startswith(lowered):
+                prefix_hits.append(key)
+        if len(prefix_hits) == 1:
+            return prefix_hits[0]
+
         sorted_matches = self.get_sorted_key_matches(key_name)
 
         if not sorted_matches:
@@ -315,6 +459,9 @@ class ConfigCommand(Command):
                 - `True` if a setting is successfully modified.
                 - `False` otherwise (e.g., user cancels, queries a value, or views settings).
         """
+        settings = self.command_manager.simulation.settings
+        command_queue = self.command_manager.simulation.command_queue
+
         if config_key:
             matched_key = self.get_best_match_key(config_key)
 
@@ -327,37 +474,26 @@ class ConfigCommand(Command):
                 new_value = config_value
             else:
                 new_value = input(
-                    f"Enter a new {self.command_manager.simulation.settings.get_key_type(matched_key)} value for '{matched_key}' (leave blank to cancel): {Style.DIM}"
+                    f"Enter a new {self.get_key_info(matched_key)[0]} value for '{matched_key}' (leave blank to cancel): {_DIM}"
                 )
-                print(Style.NORMAL, end="")
+                print(_NORMAL, end="")
 
             if new_value == "":
                 return False
 
-            try:
-                if "." in new_value:
-                    new_value = float(new_value)
-                else:
-                    new_value = int(new_value)
-            except ValueError:
-                if new_value.lower() in {"true", "false"}:
-                    new_value = new_value.lower() == "true"
-                elif new_value.lower() == "none":
-                    new_value = None
+            new_value = _coerce(new_value)
 
-            self.command_manager.simulation.command_queue.put(
-                Message("config", (matched_key, new_value))
-            )
+            command_queue.put(_config_msg((matched_key, new_value)))
             return True
 
         option = -1
         while option < 1 or option > 3:
             try:
                 print(
-                    f"{Style.DIM}(1){Style.NORMAL} Modify a setting\n{Style.DIM}(2){Style.NORMAL} Query a setting\n{Style.DIM}(3){Style.NORMAL} View all settings"
+                    f"{_DIM}(1){_NORMAL} Modify a setting\n{_DIM}(2){_NORMAL} Query a setting\n{_DIM}(3){_NORMAL} View all settings"
                 )
-                tempInput = input(f"> {Style.DIM}")
-                print(Style.NORMAL, end="")
+                tempInput = input(f"> {_DIM}")
+                print(_NORMAL, end="")
                 if tempInput == "":
                     option = 1
                     break
@@ -367,9 +503,9 @@ class ConfigCommand(Command):
 
         if option == 1:
             key_name = input(
-                f"Enter a key name (leave blank to cancel): {Style.DIM}"
+                f"Enter a key name (leave blank to cancel): {_DIM}"
             ).strip()
-            print(Style.NORMAL, end="")
+            print(_NORMAL, end="")
 
             if key_name == "":
                 return False
@@ -379,34 +515,24 @@ class ConfigCommand(Command):
             if not matched_key:
                 return False
 
+            key_type, key_description = self.get_key_info(matched_key)
             new_value = input(
-                f"\n{Style.BRIGHT}>{Style.NORMAL} {Style.DIM}{matched_key}{Style.NORMAL}: {Fore.GREEN}{self.command_manager.simulation.settings[matched_key]}{Fore.RESET}\n  {self.command_manager.simulation.settings.get_key_description(matched_key)}\n\nEnter a new {Fore.CYAN}{self.command_manager.simulation.settings.get_key_type(matched_key)}{Fore.RESET} value for {Style.DIM}'{matched_key}'{Style.NORMAL} (leave blank to cancel): {Style.DIM}"
+                f"\n{_KEY_FMT}{matched_key}{_NORMAL}: {_GREEN}{settings[matched_key]}{_RESET}\n  {key_description}\n\nEnter a new {_CYAN}{key_type}{_RESET} value for {_DIM}'{matched_key}'{_NORMAL} (leave blank to cancel): {_DIM}"
             )
-            print(Style.NORMAL, end="")
+            print(_NORMAL, end="")
 
             if new_value == "":
                 return False
 
-            try:
-                if "." in new_value:
-                    new_value = float(new_value)
-                else:
-                    new_value = int(new_value)
-            except ValueError:
-                if new_value.lower() in {"true", "false"}:
-                    new_value = new_value.lower() == "true"
-                elif new_value.lower() == "none":
-                    new_value = None
+            new_value = _coerce(new_value)
 
-            self.command_manager.simulation.command_queue.put(
-                Message("config", (matched_key, new_value))
-            )
+            command_queue.put(_config_msg((matched_key, new_value)))
             return True
         elif option == 2:
             key_name = input(
-                f"Enter a key name (leave blank to cancel): {Style.DIM}"
+                f"Enter a key name (leave blank to cancel): {_DIM}"
             ).strip()
-            print(Style.NORMAL, end="")
+            print(_NORMAL, end="")
 
             if key_name == "":
                 return False
@@ -414,14 +540,17 @@ class ConfigCommand(Command):
             matched_key = self.get_best_match_key(key_name)
 
             print(
-                f"{Style.BRIGHT}>{Style.NORMAL} {Style.DIM}{matched_key}{Style.NORMAL}: {Fore.GREEN}{self.command_manager.simulation.settings[matched_key]}{Fore.RESET}\n  {self.command_manager.simulation.settings.descriptions[matched_key]}"
+                f"{_KEY_FMT}{matched_key}{_NORMAL}: {_GREEN}{settings[matched_key]}{_RESET}\n  {settings.descriptions[matched_key]}"
             )
             return False
         elif option == 3:
-            for key, value in self.command_manager.simulation.settings.data.items():
-                print(
-                    f"{Style.BRIGHT}>{Style.NORMAL} {Style.DIM}{key}{Style.NORMAL}: {Fore.GREEN}{value}{Fore.RESET}\n  {self.command_manager.simulation.settings.descriptions[key]}"
+            parts = []
+            append = parts.append
+            for key, value in settings.data.items():
+                append(
+                    f"{_KEY_FMT}{key}{_NORMAL}: {_GREEN}{value}{_RESET}\n  {settings.descriptions[key]}"
                 )
+            sys.stdout.write("\n".join(parts) + "\n")
             return False
         else:  # We shouldn't ever reach here
             return False
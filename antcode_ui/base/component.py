@@ -1,15 +1,19 @@
 # Third-Party Imports
 import pygame
-from typing import Union
+from typing import List, Union
 
 
 class Component:
+    __slots__ = ("x", "y", "width", "height", "active", "dirty")
+
     def __init__(self, x: int, y: int, width: int, height: int):
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         self.active = True
+        # Set when the whole component must be drawn again, e.g. after the window was recreated
+        self.dirty = True
 
     def update(self):
         """Method to update the component state every frame."""
@@ -19,6 +23,10 @@ class Component:
         """Method to draw the component on the screen."""
         pass
 
+    def get_dirty_rects(self) -> List[pygame.Rect]:
+        """Returns the screen areas changed by the last `draw`; the whole component unless overridden."""
+        return [pygame.Rect(self.x, self.y, self.width, self.height)]
+
     def handle_event(self, event: pygame.event.Event):
         """Method to handle events like mouse or keyboard input."""
         pass
@@ -30,3 +38,18 @@ class Component:
     def handle_keyboard_event(self, event: pygame.event.Event):
         """Handle keyboard events like key presses."""
         pass
+
+    def handle_events(self, events: List[pygame.event.Event]):
+        """Handle every event polled this frame; calls `handle_event` for each one unless overridden."""
+        for event in events:
+            self.handle_event(event)
+
+    def handle_mouse_events(self, events: List[pygame.event.Event]):
+        """Handle the mouse events polled this frame; calls `handle_mouse_event` for each one unless overridden."""
+        for event in events:
+            self.handle_mouse_event(event)
+
+    def handle_keyboard_events(self, events: List[pygame.event.Event]):
+        """Handle the keyboard events polled this frame; calls `handle_keyboard_event` for each one unless overridden."""
+        for event in events:
+            self.handle_keyboard_event(event)
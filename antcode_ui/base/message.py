@@ -15,6 +15,8 @@ class Message:
         __init__(message: str, data: Optional[Any] = None): Initializes the message object with a message and optional data.
     """
 
+    __slots__ = ("message", "data")
+
     def __init__(self, message: str, data: Optional[Any] = None) -> None:
         """
         Initializes a message object with a given message string and optional data.
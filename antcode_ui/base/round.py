@@ -1,3 +1,10 @@
+# Standard Library Imports
+from array import array
+
+# Third-Party Imports
+from typing import Sequence, Union
+
+
 class Round:
     """
     A class representing a round in a game, with associated points and board state.
@@ -8,16 +15,91 @@ class Round:
         number (int): The round number.
         north_points (int): The points scored by the north team in the round.
         south_points (int): The points scored by the south team in the round.
-        board (list[str]): The game board for the round.
+        board (tuple[bytes, ...]): The game board for the round, one ASCII-encoded row per entry.
+            Indexing a row yields the cell's byte value rather than a one-character string.
 
     Methods:
         __init__(number: int, north_points: int, south_points: int, board: Any): Initializes the round with the number, team points, and board.
     """
 
+    __slots__ = ("number", "north_points", "south_points", "board")
+
     def __init__(
-        self, number: int, north_points: int, south_points: int, board: list[str]
+        self,
+        number: int,
+        north_points: int,
+        south_points: int,
+        board: Sequence[Union[str, bytes]],
     ):
         self.number = number
         self.north_points = north_points
         self.south_points = south_points
-        self.board = board
+        self.board = tuple(
+            row.encode("ascii") if isinstance(row, str) else row for row in board
+        )
+
+
+class Rounds:
+    """
+    A column-oriented list of the rounds in a game.
+
+    Each field is kept in its own sequence, indexed by position in the game, instead of in one `Round` object per
+    round.  Stepping through the game reads a single entry from `boards`, and the scores are packed into arrays.
+
+    Attributes:
+        numbers (array.array): The round number of each round.
+        north_points (array.array): The points scored by the north team in each round.
+        south_points (array.array): The points scored by the south team in each round.
+        boards (list[tuple[bytes, ...]]): The game board of each round, as stored by `Round.board`.
+
+    Methods:
+        append(round: Round) -> None: Adds a round to the end of the game.
+        __len__() -> int: Returns the number of rounds.
+        __getitem__(index: int) -> Round: Returns the round at the given position.
+    """
+
+    __slots__ = ("numbers", "north_points", "south_points", "boards")
+
+    def __init__(self):
+        self.numbers = array("L")
+        self.north_points = array("L")
+        self.south_points = array("L")
+        self.boards: list[tuple[bytes, ...]] = []
+
+    def append(self, round: Round) -> None:
+        """
+        Adds a round to the end of the game.
+
+        Args:
+            round (Round): The round to add.
+        """
+        self.numbers.append(round.number)
+        self.north_points.append(round.north_points)
+        self.south_points.append(round.south_points)
+        self.boards.append(round.board)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rounds.
+
+        Returns:
+            int: The number of rounds in the game.
+        """
+        return len(self.boards)
+
+    def __getitem__(self, index: int) -> Round:
+        """
+        Returns the round at the given position, assembled from the stored fields.
+
+        Args:
+            index (int): The position of the round in the game.
+
+        Returns:
+            Round: The round at that position.
+        """
+        return Round(
+            self.numbers[index],
+            self.north_points[index],
+            self.south_points[index],
+            self.boards[index],
+        )
@@ -0,0 +1,136 @@
+# Standard Library Imports
+import os
+import sys
+
+# Third-Party Imports
+import pygame
+from typing import Optional
+
+IMAGES_DIR = "./antcode_ui/images"
+
+# Loaded and scaled image surfaces, keyed by (file name, edge length in pixels).  Missing files are cached as None.
+_images: dict[tuple[str, int], Optional[pygame.Surface]] = {}
+# Pre-multiplied cell sprites and the flags to blit them with, keyed like `_images`
+_sprites: dict[tuple[str, int], Optional[tuple[pygame.Surface, int]]] = {}
+
+
+def _list_images() -> dict[str, str]:
+    """
+    Returns the full path of every file in the images directory, keyed by file name.
+
+    The directory is listed once, instead of stat-ing each file and joining its path whenever it's first needed.
+    Names and paths are interned, so lookups with the renderer's constant file names compare by identity.  A
+    missing directory yields no paths, so every image is treated as missing.
+
+    Returns:
+        dict[str, str]: The image paths.
+    """
+    try:
+        names = os.listdir(IMAGES_DIR)
+    except OSError:
+        return {}
+    return {sys.intern(name): sys.intern(os.path.join(IMAGES_DIR, name)) for name in names}
+
+
+# Full paths of the image files available on disk, keyed by file name
+_paths = _list_images()
+
+
+def _has_transparency(image: pygame.Surface) -> bool:
+    """
+    Checks whether an image has any pixel that isn't fully opaque.
+
+    PNGs saved with an alpha channel that's 255 everywhere (wall.png, empty.png) can be converted without alpha, which
+    turns their blits into plain copies.
+
+    Args:
+        image (pygame.Surface): The image to check.
+
+    Returns:
+        bool: True if the image has a colorkey or at least one translucent pixel.
+    """
+    if image.get_colorkey() is not None:
+        return True
+    if not image.get_flags() & pygame.SRCALPHA:
+        return False
+    width, height = image.get_size()
+    return pygame.mask.from_surface(image, 254).count() != width * height
+
+
+def get_image(name: str, size: int) -> Optional[pygame.Surface]:
+    """
+    Returns the image with the given file name scaled to a square of the given size.
+
+    Images are loaded, converted to the display's pixel format and scaled the first time they're requested at a
+    given size, after which the cached surface is shared by every caller.
+
+    Args:
+        name (str): The file name of the image within the images directory.
+        size (int): The width and height to scale the image to, in pixels.
+
+    Returns:
+        Optional[pygame.Surface]: The scaled image, or None if the image file doesn't exist.
+    """
+    key = (name, size)
+    try:
+        return _images[key]
+    except KeyError:
+        pass
+
+    image = None
+    image_path = _paths.get(name)
+    if image_path is not None:
+        image = pygame.image.load(image_path)
+        if pygame.display.get_surface() is None:
+            # convert() needs a display mode to match; hand out the raw image and convert it once one is set
+            return pygame.transform.scale(image, (size, size))
+        # Match the display's pixel format so blits don't convert per pixel; only keep alpha where it's used
+        image = image.convert_alpha() if _has_transparency(image) else image.convert()
+        image = pygame.transform.scale(image, (size, size))
+    _images[key] = image
+    return image
+
+
+def get_sprite(name: str, size: int) -> Optional[tuple[pygame.Surface, int]]:
+    """
+    Returns a cell sprite prepared for fast blitting, along with the blend flag to blit it with.
+
+    Images with an alpha channel are pre-multiplied once and blitted with `pygame.BLEND_PREMULTIPLIED`, which is
+    cheaper than pygame's regular per-pixel alpha blending.  Opaque images are returned as is.
+
+    Args:
+        name (str): The file name of the image within the images directory.
+        size (int): The width and height to scale the image to, in pixels.
+
+    Returns:
+        Optional[tuple[pygame.Surface, int]]: The sprite and its blit flags, or None if the image file doesn't
+            exist.
+    """
+    key = (name, size)
+    try:
+        return _sprites[key]
+    except KeyError:
+        pass
+
+    sprite = None
+    image = get_image(name, size)
+    if image is not None:
+        if image.get_flags() & pygame.SRCALPHA:
+            sprite = (image.premul_alpha(), pygame.BLEND_PREMULTIPLIED)
+        else:
+            sprite = (image, 0)
+        if pygame.display.get_surface() is None:
+            # get_image didn't cache the unconverted image either; build the sprite again once it's converted
+            return sprite
+    _sprites[key] = sprite
+    return sprite
+
+
+def clear() -> None:
+    """
+    Drops every cached image and sprite, and lists the images directory again.
+    """
+    global _paths
+    _images.clear()
+    _sprites.clear()
+    _paths = _list_images()
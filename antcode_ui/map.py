@@ -1,21 +1,71 @@
 # Standard Library Imports
-import os
+import re
+import sys
+from bisect import bisect_left
 
 # Third-Party Imports
 import pygame
 from typing import Union, Optional
 
 # Local Imports
-from . import WHITE, BLACK, COLORS, BLANK_MAP
+from . import WHITE, BLACK, COLOR_TABLE, BLANK_BOARD, image_cache
 from .base import Component
 
+# Byte values of the map characters the renderer treats specially
+_EMPTY = ord(".")
+_WALL = ord("#")
+
+# Image file drawn for each anthill and ant cell, so the names aren't formatted per cell.  Interned to match the
+# image cache's keys.
+_CELL_IMAGES = {
+    ord("@"): "north.png",
+    ord("X"): "south.png",
+    **{ord(ant): sys.intern(f"ant-{ant.lower()}.png") for ant in "ABCDEFGHIJ"},
+    **{ord(ant): sys.intern(f"ant-{ant}-food.png") for ant in "abcdefghij"},
+}
+
+# Image file of each ant's top bar icon, keyed by (ant letter, whether it's holding food)
+_ANT_IMAGES = {
+    **{(ant, False): _CELL_IMAGES[ord(ant)] for ant in "ABCDEFGHIJ"},
+    **{(ant, True): _CELL_IMAGES[ord(ant.lower())] for ant in "ABCDEFGHIJ"},
+}
+
+# Cell values by kind, and the label drawn on food piles (their amount) and ants (their letter)
+_FOOD_CELLS = frozenset(b"0123456789")
+_NORTH_ANTHILL = ord("@")
+_ANTHILL_CELLS = frozenset(b"@X")
+_ANT_CELLS = frozenset(b"ABCDEFGHIJabcdefghij")
+_CELL_LABELS = {
+    **{cell: chr(cell) for cell in _FOOD_CELLS},
+    **{cell: chr(cell).upper() for cell in _ANT_CELLS},
+}
+
+# Kind of every occupied cell value, indexed by the value (0 for empty cells and walls)
+_KIND_FOOD = 1
+_KIND_NORTH_ANTHILL = 2
+_KIND_SOUTH_ANTHILL = 3
+_KIND_ANT = 4
+_CELL_KINDS = bytes(
+    _KIND_FOOD if value in _FOOD_CELLS
+    else _KIND_NORTH_ANTHILL if value == _NORTH_ANTHILL
+    else _KIND_SOUTH_ANTHILL if value in _ANTHILL_CELLS
+    else _KIND_ANT if value in _ANT_CELLS
+    else 0
+    for value in range(256)
+)
+
+# Patterns locating walls and the other non-empty cells in a flattened board
+_WALLS = re.compile(rb"#")
+_OCCUPIED = re.compile(rb"[^.#]")
+_EMPTY_OR_WALL = re.compile(rb"[.#]")
+
 
 class MapComponent(Component):
     """
     A component that displays a map on the screen with visual representations for different map elements.
 
     This class inherits from `Component` and provides functionality for drawing a grid-based map using
-    a 2D array of strings (`map_data`). Each character in the `map_data` array represents an element on
+    a 2D array of byte rows (`map_data`). Each character in the `map_data` array represents an element on
     the map, which could be a number, letter, or an alpha character that corresponds to a specific image.
     The class handles rendering map cells, drawing colors, and overlaying text or images depending on the
     type of character in each cell.
@@ -25,7 +75,7 @@ class MapComponent(Component):
         y (int): The y-coordinate of the top-left corner of the map component.
         width (int): The width of the map component.
         height (int): The height of the map component.
-        map_data (list[str]): A 2D list (array) of strings representing the map. Each string element can contain
+        map_data (tuple[bytes, ...]): A 2D array of ASCII byte rows representing the map. Each row can contain
                               characters that represent different types of map elements.
         font (pygame.font.Font): A pygame font object used for rendering text on the map.
     """
@@ -35,21 +85,329 @@ class MapComponent(Component):
 
     NORTH_TEAM_COLOR = (255, 200, 200)
     SOUTH_TEAM_COLOR = (200, 200, 255)
+    GRID_COLOR = (100, 100, 100)
+    # Fill color of the see-through part of the cell border surface; must differ from GRID_COLOR
+    BORDER_COLORKEY = (255, 0, 255)
+
+    TEXT_CACHE_SIZE = 512
 
     def __init__(
-        self, x: int, y: int, width: int, height: int, map_data: list[str], simulation
+        self, x: int, y: int, width: int, height: int, map_data: tuple[bytes, ...], simulation
     ):
         super().__init__(x, y, width, height)
         self.map_data = map_data
         pygame.font.init()
         self.font24 = pygame.font.SysFont(None, 24)
         self.font32 = pygame.font.SysFont(None, 32)
+        self.tooltip_font = pygame.font.Font(None, 24)
         self.simulation = simulation
 
+        # Per-map cell and wall lists built by _get_map_cells, and the map_data they were built from
+        self._cells_source: Optional[tuple[bytes, ...]] = None
+        self._cell_offsets: list[int] = []
+        self._cell_values = b""
+        self._wall_cells: list[tuple[int, int]] = []
+        # What to blit for each cell value, indexed by the value, plus the cell size and settings it was built for
+        self._recipes_key: Optional[tuple] = None
+        self._recipes: list[tuple[tuple[pygame.Surface, int, int, int], ...]] = []
+        # Whether every recipe entry stays inside its cell, so cells can be redrawn independently of each other
+        self._recipes_fit = True
+        # Floor, grid and walls for the current map, plus the layout it was built for
+        self._background_key: Optional[tuple[int, int, int, bool]] = None
+        self._background_walls: Optional[list[tuple[int, int]]] = None
+        self._background: Optional[pygame.Surface] = None
+        # Rectangle of every cell, plus the (rows, cols, cell size, x, y) grid they were laid out for
+        self._cell_rects_key: Optional[tuple[int, int, int, int, int]] = None
+        self._cell_rects: list[pygame.Rect] = []
+        # Distinct cell values on the map, for the top bar's alive / holding-food checks
+        self._present_source: Optional[tuple[bytes, ...]] = None
+        self._present_cells: frozenset[int] = frozenset()
+        # Both teams' top bars, plus the scores, ant states and layout they were rendered with
+        self._top_bar_key: Optional[tuple] = None
+        self._top_bar: Optional[pygame.Surface] = None
+        # The last rendered map, plus the map_data and render settings it was rendered with
+        self._frame_source: Optional[tuple[bytes, ...]] = None
+        self._frame_key: Optional[tuple] = None
+        self._frame: Optional[pygame.Surface] = None
+        # Bumped whenever the frame is re-rendered, and the version last drawn to the screen in full
+        self._frame_version = 0
+        self._drawn_frame_version: Optional[int] = None
+        # Screen areas of the hover overlay and tooltip from the last draw, and everything the last draw changed
+        self._hover_rects: list[pygame.Rect] = []
+        self._dirty_rects: list[pygame.Rect] = []
+        # Rendered text surfaces, keyed by (font id, text, color)
+        self._text_cache: dict[tuple[int, str, tuple], pygame.Surface] = {}
+        # Translucent cell-sized squares, keyed by (RGBA color, cell size)
+        self._overlay_cache: dict[tuple[tuple[int, int, int, int], int], pygame.Surface] = {}
+        # Cell border outlines with a see-through middle, keyed by cell size
+        self._border_cache: dict[int, pygame.Surface] = {}
+
         if self.simulation.has_five_ants:
             MapComponent.NORTH_ANTS = ["A", "B", "C", "D", "E"]
             MapComponent.SOUTH_ANTS = ["F", "G", "H", "I", "J"]
 
+        # Pre-render the labels drawn every frame: ant letters (white when alive, black when dead or on the map) and
+        # food pile amounts
+        for ant in MapComponent.NORTH_ANTS + MapComponent.SOUTH_ANTS:
+            self._render_text(ant, self.font24, WHITE)
+            self._render_text(ant, self.font24, BLACK)
+        for amount in "0123456789":
+            self._render_text(amount, self.font24, BLACK)
+
+    def _render_text(
+        self, text: str, font: pygame.font.Font, color: tuple[int, int, int, Optional[int]] = WHITE
+    ) -> pygame.Surface:
+        """
+        Returns the rendered surface for a string, rasterizing it only the first time it's drawn.
+
+        Most strings on the map (scores, the step counter, ant and food labels) repeat across frames, so their
+        surfaces are kept and reused, converted to the display's pixel format. The cache is cleared once it holds
+        `TEXT_CACHE_SIZE` entries.
+
+        Args:
+            text (str): The text to render.
+            font (pygame.font.Font): The font to render the text with.
+            color (tuple[int, int, int, Optional[int]]): The color of the text.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= MapComponent.TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+
+    def _get_overlay(self, color: tuple[int, int, int, int], cell_size: int) -> pygame.Surface:
+        """
+        Returns a translucent square the size of one cell, filled with the given color.
+
+        The same few tints (food, team colors and the hover highlight) are laid over many cells each frame, so each
+        square is filled once and shared.  Changing the cell size simply builds new squares at the new size.
+
+        Args:
+            color (tuple[int, int, int, int]): The RGBA color to fill the square with.
+            cell_size (int): The width and height of the square, in pixels.
+
+        Returns:
+            pygame.Surface: The filled square.
+        """
+        key = (color, cell_size)
+        overlay = self._overlay_cache.get(key)
+        if overlay is None:
+            overlay = self._overlay_cache[key] = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+            overlay.fill(color)
+        return overlay
+
+    def _get_cell_border(self, cell_size: int) -> pygame.Surface:
+        """
+        Returns a cell-sized square holding just the cell's 1px border, with the inside keyed out.
+
+        Occupied cells get their border drawn back over their contents.  Blitting this square along with the rest
+        of the cell's surfaces replaces a separate `pygame.draw.rect` outline call per cell.
+
+        Args:
+            cell_size (int): The width and height of the square, in pixels.
+
+        Returns:
+            pygame.Surface: The border square.
+        """
+        border = self._border_cache.get(cell_size)
+        if border is None:
+            border = pygame.Surface((cell_size, cell_size))
+            if pygame.display.get_surface() is not None:
+                border = border.convert()
+            border.fill(MapComponent.BORDER_COLORKEY)
+            border.set_colorkey(MapComponent.BORDER_COLORKEY)
+            pygame.draw.rect(border, MapComponent.GRID_COLOR, border.get_rect(), 1)
+            self._border_cache[cell_size] = border
+        return border
+
+    def _get_map_cells(self) -> tuple[list[int], bytes, list[tuple[int, int]]]:
+        """
+        Returns the cells of the current map that need drawing beyond the background.
+
+        The occupied cells (food, anthills and ants) are kept as two parallel sequences rather than a list of
+        tuples: their row-major offsets into the board (`row * cols + col`) and their cell values.  Everything is
+        rebuilt only when `map_data` is replaced, so each frame visits just the occupied cells instead of every
+        cell on the board.
+
+        Returns:
+            tuple[list[int], bytes, list[tuple[int, int]]]: The offsets of the occupied cells in row-major order,
+                their cell values in the same order, and the (row, column) positions of the walls.
+        """
+        if self._cells_source is not self.map_data:
+            self._cells_source = self.map_data
+            cols = len(self.map_data[0])
+            # Scan one flat buffer with the regex engine rather than visiting every cell in Python
+            flat = b"".join(self.map_data)
+            self._wall_cells = [divmod(match.start(), cols) for match in _WALLS.finditer(flat)]
+            self._cell_offsets = [match.start() for match in _OCCUPIED.finditer(flat)]
+            self._cell_values = _EMPTY_OR_WALL.sub(b"", flat)
+        return self._cell_offsets, self._cell_values, self._wall_cells
+
+    def _get_background_layer(
+        self, rows: int, cols: int, cell_size: int, fancy: bool, wall_cells: list[tuple[int, int]]
+    ) -> pygame.Surface:
+        """
+        Returns a grid-sized surface with the parts of the map that don't change between steps: the floor (plain
+        color or grass), the cell borders and the walls.
+
+        The layer is rebuilt only when the grid size, cell size, graphics mode or wall layout changes, which for
+        a loaded game normally means once.
+
+        Args:
+            rows (int): The number of rows in the map.
+            cols (int): The number of columns in the map.
+            cell_size (int): The width and height of each cell, in pixels.
+            fancy (bool): Whether fancy graphics are enabled.
+            wall_cells (list[tuple[int, int]]): The (row, column) positions of the walls.
+
+        Returns:
+            pygame.Surface: The background layer, to be blitted at the top-left corner of the grid.
+        """
+        key = (rows, cols, cell_size, fancy)
+        if self._background_key != key or self._background_walls != wall_cells:
+            self._background_key = key
+            self._background_walls = wall_cells
+
+            self._background = pygame.Surface((cols * cell_size, rows * cell_size)).convert()
+            self._background.fill(BLACK)
+            paint = self._paint_fancy_background if fancy else self._paint_plain_background
+            paint(self._background, rows, cols, cell_size, wall_cells)
+        return self._background
+
+    def _paint_plain_background(
+        self, layer: pygame.Surface, rows: int, cols: int, cell_size: int, wall_cells: list[tuple[int, int]]
+    ):
+        """
+        Paints the background layer for plain graphics: a flat floor color, the grid and solid wall cells.
+
+        Args:
+            layer (pygame.Surface): The grid-sized surface to paint.
+            rows (int): The number of rows in the map.
+            cols (int): The number of columns in the map.
+            cell_size (int): The width and height of each cell, in pixels.
+            wall_cells (list[tuple[int, int]]): The (row, column) positions of the walls.
+        """
+        layer.fill(COLOR_TABLE[_EMPTY])
+        self._draw_grid_lines(layer, cell_size)
+
+        # Walls are drawn over the grid lines, since they don't get a border.  Nothing is blitted here, so the
+        # layer is locked once for all the rects instead of by each draw call.
+        draw_rect = pygame.draw.rect
+        wall_color = COLOR_TABLE[_WALL]
+        layer.lock()
+        for row_idx, col_idx in wall_cells:
+            draw_rect(layer, wall_color, (col_idx * cell_size, row_idx * cell_size, cell_size, cell_size))
+        layer.unlock()
+
+    def _paint_fancy_background(
+        self, layer: pygame.Surface, rows: int, cols: int, cell_size: int, wall_cells: list[tuple[int, int]]
+    ):
+        """
+        Paints the background layer for fancy graphics: the grass, the grid and the wall image on wall cells.
+
+        Args:
+            layer (pygame.Surface): The grid-sized surface to paint.
+            rows (int): The number of rows in the map.
+            cols (int): The number of columns in the map.
+            cell_size (int): The width and height of each cell, in pixels.
+            wall_cells (list[tuple[int, int]]): The (row, column) positions of the walls.
+        """
+        # The grass tile covers 4x4 cells and is tiled straight onto the layer, which is itself only repainted when
+        # the layout changes
+        grass_image = image_cache.get_image("empty.png", cell_size * 4)
+        if grass_image is not None:
+            tile = cell_size * 4
+            layer.blits(
+                [
+                    (grass_image, (col_x, row_y))
+                    for row_y in range(0, rows * cell_size, tile)
+                    for col_x in range(0, cols * cell_size, tile)
+                ],
+                doreturn=False,
+            )
+        self._draw_grid_lines(layer, cell_size)
+
+        # Walls are drawn over the grid lines, since they don't get a border
+        wall_image = image_cache.get_image("wall.png", cell_size)
+        if wall_image is not None:
+            layer.blits(
+                [(wall_image, (col_idx * cell_size, row_idx * cell_size)) for row_idx, col_idx in wall_cells],
+                doreturn=False,
+            )
+
+    def _draw_grid_lines(self, layer: pygame.Surface, cell_size: int):
+        """
+        Draws the border of every cell across a grid-sized surface.
+
+        Each cell's border is its own 1px outline, so every row and column contributes a line along both of its
+        edges.
+
+        Args:
+            layer (pygame.Surface): The grid-sized surface to draw on.
+            cell_size (int): The width and height of each cell, in pixels.
+        """
+        width, height = layer.get_size()
+        # 1px-wide fills are straight memory writes, where draw.line goes through the line rasterizer.  The layer is
+        # locked once around all of them.
+        fill = layer.fill
+        layer.lock()
+        for edge in range(0, height, cell_size):
+            fill(MapComponent.GRID_COLOR, (0, edge, width, 1))
+            fill(MapComponent.GRID_COLOR, (0, edge + cell_size - 1, width, 1))
+        for edge in range(0, width, cell_size):
+            fill(MapComponent.GRID_COLOR, (edge, 0, 1, height))
+            fill(MapComponent.GRID_COLOR, (edge + cell_size - 1, 0, 1, height))
+        layer.unlock()
+
+    def _get_cell_rects(
+        self, rows: int, cols: int, cell_size: int, x0: int, y_top: int
+    ) -> list[pygame.Rect]:
+        """
+        Returns a table of the rectangles occupied by each cell, indexed by row-major offset (`row * cols + col`).
+
+        The table is rebuilt only when the grid's size, position or cell size changes, so rendering a step doesn't
+        allocate a new `pygame.Rect` for every cell it draws.  The rectangles are shared and must not be modified.
+
+        Args:
+            rows (int): The number of rows in the map.
+            cols (int): The number of columns in the map.
+            cell_size (int): The width and height of each cell, in pixels.
+            x0 (int): The x-coordinate of the grid's left edge.
+            y_top (int): The y-coordinate of the grid's top edge.
+
+        Returns:
+            list[pygame.Rect]: The cell rectangles.
+        """
+        key = (rows, cols, cell_size, x0, y_top)
+        if self._cell_rects_key != key:
+            self._cell_rects_key = key
+            self._cell_rects = [
+                pygame.Rect(x0 + col_idx * cell_size, y_top + row_idx * cell_size, cell_size, cell_size)
+                for row_idx in range(rows)
+                for col_idx in range(cols)
+            ]
+        return self._cell_rects
+
+    def _get_present_cells(self) -> frozenset[int]:
+        """
+        Returns the set of distinct cell values on the current map, rebuilt only when `map_data` is replaced.
+
+        Returns:
+            frozenset[int]: The byte value of every character that appears somewhere on the map.
+        """
+        if self._present_source is not self.map_data:
+            self._present_source = self.map_data
+            self._present_cells = frozenset(b"".join(self.map_data))
+        return self._present_cells
+
     def is_ant_alive(self, ant: str) -> bool:
         """
         Checks if a given ant is present on the map.
@@ -60,7 +418,8 @@ class MapComponent(Component):
         Returns:
             bool: True if the given ant is present on the map.
         """
-        return any(ant.lower() in item.lower() for item in self.map_data)
+        present = self._get_present_cells()
+        return ord(ant.lower()) in present or ord(ant.upper()) in present
 
     def is_ant_holding_food(self, ant: str) -> bool:
         """
@@ -72,10 +431,7 @@ class MapComponent(Component):
         Returns:
             bool: True if the given ant is alive and holding food.
         """
-
-        return self.is_ant_alive(ant) and any(
-            ant.lower() in item for item in self.map_data
-        )
+        return self.is_ant_alive(ant) and ord(ant.lower()) in self._get_present_cells()
 
     def draw_string(
         self,
@@ -98,449 +454,534 @@ class MapComponent(Component):
             font (pygame.font.Font): The font to use.
             screen (pygame.Surface): The pygame surface to draw on.
         """
-        text_surface = font.render(text, True, color)
-        text_rect = None
+        text_surface = self._render_text(text, font, color)
         if center:
-            text_rect = text_surface.get_rect(center=(x, y))
+            width, height = text_surface.get_size()
+            screen.blit(text_surface, (x - width // 2, y - height // 2))
         else:
-            text_rect = (x, y)
-        screen.blit(text_surface, text_rect)
+            screen.blit(text_surface, (x, y))
 
     def render_top_bar_north_team(
-        self, screen: Union[pygame.Surface, pygame.SurfaceType]
+        self,
+        screen: Union[pygame.Surface, pygame.SurfaceType],
+        origin: Optional[tuple[int, int]] = None,
     ):
         """
         Draws the top bar for the north team, showing their score and ants.
 
         Args:
             screen (pygame.Surface): The pygame surface to draw on.
+            origin (Optional[tuple[int, int]]): Where the component's top-left corner is on `screen`. Defaults to
+                the component's own position.
         """
-        northAnthillRect = pygame.Rect(
-            self.x, self.y, self.width // 2, self.simulation.settings["cellSize"]
-        )
+        cell_size = self.simulation.settings["cellSize"]
+        x0, y0 = origin if origin is not None else (self.x, self.y)
+        font24 = self.font24
+        render_text = self._render_text
+        get_image = image_cache.get_image
+        dead_image = get_image("dead.png", cell_size)
+
+        northAnthillRect = pygame.Rect(x0, y0, self.width // 2, cell_size)
         pygame.draw.rect(screen, MapComponent.NORTH_TEAM_COLOR, northAnthillRect)
-        image_path = os.path.join(
-            "./antcode_ui/images",
-            "north.png",
-        )
-        if os.path.exists(image_path):
-            image = pygame.image.load(image_path)
-            image = pygame.transform.scale(
-                image,
-                (
-                    self.simulation.settings["cellSize"],
-                    self.simulation.settings["cellSize"],
-                ),
-            )
-            screen.blit(image, (self.x, self.y))
-        northScore = f"Score: {self.simulation.maps[self.simulation.current_map_index].north_points}"
-        northScoreWidth, northScoreHeight = self.font24.size(northScore)
-        self.draw_string(
-            northScore,
-            self.x + self.simulation.settings["cellSize"] + 7,
-            self.y + self.simulation.settings["cellSize"] // 2 - northScoreHeight // 2,
-            False,
-            self.font24,
-            screen,
-        )
+
+        # Icons and text are collected in drawing order and blitted with a single call
+        batch = []
+        add = batch.append
+        image = get_image("north.png", cell_size)
+        if image is not None:
+            add((image, (x0, y0)))
+        northScore = f"Score: {self.simulation.maps.north_points[self.simulation.current_map_index]}"
+        score_surface = render_text(northScore, font24)
+        northScoreWidth, northScoreHeight = score_surface.get_size()
+        add((score_surface, (x0 + cell_size + 7, y0 + cell_size // 2 - northScoreHeight // 2)))
         for ant, idx in zip(MapComponent.NORTH_ANTS, range(0, (5 if self.simulation.has_five_ants else 4))):
-            image_path = os.path.join(
-                "./antcode_ui/images",
-                f"ant-{ant.lower()}{'-food' if self.is_ant_holding_food(ant) and self.is_ant_alive(ant) else ''}.png",
-            )
-            if os.path.exists(image_path):
-                image = pygame.image.load(image_path)
-                image = pygame.transform.scale(
-                    image,
+            # Check the ant's state once; both checks are lookups into the map's set of present characters
+            alive = self.is_ant_alive(ant)
+            holding_food = alive and self.is_ant_holding_food(ant)
+            image = get_image(_ANT_IMAGES[ant, holding_food], cell_size)
+            if image is not None:
+                icon_pos = (x0 + (idx + 1) * cell_size + 15 + northScoreWidth, y0 - 2)
+                add((image, icon_pos))
+                if not alive:
+                    if dead_image is not None:
+                        add((dead_image, icon_pos))
+                label = render_text(ant, font24, WHITE if alive else BLACK)
+                label_width, label_height = label.get_size()
+                add(
                     (
-                        self.simulation.settings["cellSize"],
-                        self.simulation.settings["cellSize"],
-                    ),
-                )
-                screen.blit(
-                    image,
-                    (
-                        self.x
-                        + (idx + 1) * self.simulation.settings["cellSize"]
-                        + 15
-                        + northScoreWidth,
-                        self.y - 2,
-                    ),
-                )
-                if not self.is_ant_alive(ant):
-                    dead_ant = os.path.join("./antcode_ui/images", "dead.png")
-                    if os.path.exists(dead_ant):
-                        overlay_image = pygame.image.load(dead_ant)
-                        overlay_image = pygame.transform.scale(
-                            overlay_image,
-                            (
-                                self.simulation.settings["cellSize"],
-                                self.simulation.settings["cellSize"],
-                            ),
-                        )
-                        screen.blit(
-                            overlay_image,
-                            (
-                                self.x
-                                + (idx + 1) * self.simulation.settings["cellSize"]
-                                + 15
-                                + northScoreWidth,
-                                self.y - 2,
-                            ),
-                        )
-                self.draw_string(
-                    ant,
-                    self.x
-                    + (idx + 2) * self.simulation.settings["cellSize"]
-                    + 5
-                    + northScoreWidth,
-                    self.y + self.simulation.settings["cellSize"] - 12,
-                    True,
-                    self.font24,
-                    screen,
-                    WHITE if self.is_ant_alive(ant) else BLACK,
+                        label,
+                        (
+                            x0 + (idx + 2) * cell_size + 5 + northScoreWidth - label_width // 2,
+                            y0 + cell_size - 12 - label_height // 2,
+                        ),
+                    )
                 )
+        screen.blits(batch, doreturn=False)
 
     def render_top_bar_south_team(
-        self, screen: Union[pygame.Surface, pygame.SurfaceType]
+        self,
+        screen: Union[pygame.Surface, pygame.SurfaceType],
+        origin: Optional[tuple[int, int]] = None,
     ):
         """
         Draws the top bar for the south team, showing their score and ants.
 
         Args:
             screen (pygame.Surface): The pygame surface to draw on.
+            origin (Optional[tuple[int, int]]): Where the component's top-left corner is on `screen`. Defaults to
+                the component's own position.
         """
+        cell_size = self.simulation.settings["cellSize"]
+        x0, y0 = origin if origin is not None else (self.x, self.y)
+        x1 = x0 + self.width
+        font24 = self.font24
+        render_text = self._render_text
+        get_image = image_cache.get_image
+        dead_image = get_image("dead.png", cell_size)
+
         # Define top bar region for south team
         southAnthillRect = pygame.Rect(
-            self.x + self.width // 2,
-            self.y,
+            x0 + self.width // 2,
+            y0,
             self.width // 2,
-            self.simulation.settings["cellSize"],
+            cell_size,
         )
         pygame.draw.rect(screen, MapComponent.SOUTH_TEAM_COLOR, southAnthillRect)
 
+        # Icons and text are collected in drawing order and blitted with a single call
+        batch = []
+        add = batch.append
+
         # Load in south team icon
-        image_path = os.path.join(
-            "./antcode_ui/images",
-            "south.png",
-        )
-        if os.path.exists(image_path):
-            image = pygame.image.load(image_path)
-            image = pygame.transform.scale(
-                image,
-                (
-                    self.simulation.settings["cellSize"],
-                    self.simulation.settings["cellSize"],
-                ),
-            )
-            screen.blit(
-                image,
-                (self.x + self.width - self.simulation.settings["cellSize"], self.y),
-            )
+        image = get_image("south.png", cell_size)
+        if image is not None:
+            add((image, (x1 - cell_size, y0)))
 
         # Render score text
-        southScore = f"Score: {self.simulation.maps[self.simulation.current_map_index].south_points}"
-        southScoreWidth, southScoreHeight = self.font24.size(southScore)
-        self.draw_string(
-            southScore,
-            self.x
-            + self.width
-            - (self.simulation.settings["cellSize"] + 7)
-            - southScoreWidth,
-            self.y + self.simulation.settings["cellSize"] // 2 - southScoreHeight // 2,
-            False,
-            self.font24,
-            screen,
-        )
+        southScore = f"Score: {self.simulation.maps.south_points[self.simulation.current_map_index]}"
+        score_surface = render_text(southScore, font24)
+        southScoreWidth, southScoreHeight = score_surface.get_size()
+        add((score_surface, (x1 - (cell_size + 7) - southScoreWidth, y0 + cell_size // 2 - southScoreHeight // 2)))
         for ant, idx in zip(reversed(MapComponent.SOUTH_ANTS), range(0, (5 if self.simulation.has_five_ants else 4))):
-            image_path = os.path.join(
-                "./antcode_ui/images",
-                f"ant-{ant.lower()}{'-food' if self.is_ant_holding_food(ant) and self.is_ant_alive(ant) else ''}.png",
-            )
-            if os.path.exists(image_path):
-                image = pygame.image.load(image_path)
-                image = pygame.transform.scale(
-                    image,
+            # Check the ant's state once; both checks are lookups into the map's set of present characters
+            alive = self.is_ant_alive(ant)
+            holding_food = alive and self.is_ant_holding_food(ant)
+            image = get_image(_ANT_IMAGES[ant, holding_food], cell_size)
+            if image is not None:
+                icon_pos = (x1 - ((idx + 2) * cell_size + 7) - southScoreWidth, y0 - 2)
+                add((image, icon_pos))
+                if not alive:
+                    if dead_image is not None:
+                        add((dead_image, icon_pos))
+                label = render_text(ant, font24, WHITE if alive else BLACK)
+                label_width, label_height = label.get_size()
+                add(
                     (
-                        self.simulation.settings["cellSize"],
-                        self.simulation.settings["cellSize"],
-                    ),
-                )
-                screen.blit(
-                    image,
-                    (
-                        self.x
-                        + self.width
-                        - ((idx + 2) * self.simulation.settings["cellSize"] + 7)
-                        - southScoreWidth,
-                        self.y - 2,
-                    ),
-                )
-                if not self.is_ant_alive(ant):
-                    dead_ant = os.path.join(
-                        "./antcode_ui/images",
-                        "dead.png",
+                        label,
+                        (
+                            x1 - ((idx + 1) * cell_size + 17) - southScoreWidth - label_width // 2,
+                            y0 + cell_size - 12 - label_height // 2,
+                        ),
                     )
-                    if os.path.exists(dead_ant):
-                        overlay_image = pygame.image.load(dead_ant)
-                        overlay_image = pygame.transform.scale(
-                            overlay_image,
-                            (
-                                self.simulation.settings["cellSize"],
-                                self.simulation.settings["cellSize"],
-                            ),
-                        )
-                        screen.blit(
-                            overlay_image,
-                            (
-                                self.x
-                                + self.width
-                                - ((idx + 2) * self.simulation.settings["cellSize"] + 7)
-                                - southScoreWidth,
-                                self.y - 2,
-                            ),
-                        )
-                self.draw_string(
-                    ant,
-                    self.x
-                    + self.width
-                    - ((idx + 1) * self.simulation.settings["cellSize"] + 17)
-                    - southScoreWidth,
-                    self.y + self.simulation.settings["cellSize"] - 12,
-                    True,
-                    self.font24,
-                    screen,
-                    WHITE if self.is_ant_alive(ant) else BLACK,
                 )
+        screen.blits(batch, doreturn=False)
 
-    def draw(self, screen: Union[pygame.Surface, pygame.SurfaceType]):
+    def _get_top_bar(self, cell_size: int) -> pygame.Surface:
         """
-        Draws the map on the given screen surface with interactive hover effects and tooltips.
+        Returns a surface with both teams' top bars rendered onto it, without the step counter.
+
+        The bars only show the scores and which ants are alive or carrying food, which usually stay the same over
+        many steps, so they're re-rendered only when one of those or the layout changes.
 
         Args:
-            screen (Union[pygame.Surface, pygame.SurfaceType]): The pygame surface to which the map will be drawn.
+            cell_size (int): The width and height of each cell, in pixels.  The bar is one cell tall.
+
+        Returns:
+            pygame.Surface: A surface as wide as the component and one cell tall.
         """
-        cell_offset = (
-            1
-            if self.map_data is not BLANK_MAP and self.simulation.settings["showTopBar"]
-            else 0
+        # Read the scores straight from the packed arrays; indexing the rounds would build a Round to read them from
+        maps = self.simulation.maps
+        map_index = self.simulation.current_map_index
+        key = (
+            self.width,
+            cell_size,
+            self.simulation.has_five_ants,
+            maps.north_points[map_index],
+            maps.south_points[map_index],
+            # Which ants are on the map, and in which form, decides every ant's alive and holding-food state
+            self._get_present_cells() & _ANT_CELLS,
+        )
+        if self._top_bar_key != key:
+            self._top_bar_key = key
+            if self._top_bar is None or self._top_bar.get_size() != (self.width, cell_size):
+                self._top_bar = pygame.Surface((self.width, cell_size)).convert()
+            self._top_bar.fill(BLACK)
+            self.render_top_bar_north_team(self._top_bar, (0, 0))
+            self.render_top_bar_south_team(self._top_bar, (0, 0))
+        return self._top_bar
+
+    def _get_cell_recipes(self, cell_size: int) -> list[tuple[tuple[pygame.Surface, int, int, int], ...]]:
+        """
+        Returns what to blit for every possible cell value.
+
+        How a cell is drawn depends only on its value and the render settings, so the decisions (which overlay,
+        sprite and label, and whether each one is shown) are made once per value here instead of once per cell in
+        the render loop.  Each value maps to a sequence of `(surface, x offset, y offset, blend flags)` entries,
+        in drawing order and relative to the cell's top-left corner.  Empty cells and walls map to no entries.
+
+        Args:
+            cell_size (int): The width and height of each cell, in pixels.
+
+        Returns:
+            list[tuple[tuple[pygame.Surface, int, int, int], ...]]: The blit entries, indexed by cell value.
+        """
+        settings = self.simulation.settings
+        foodpile_info = settings["foodpileInfo"]
+        ant_info = settings["antInfo"]
+        anthill_info = settings["anthillInfo"]
+        key = (
+            cell_size,
+            foodpile_info,
+            ant_info,
+            anthill_info,
+            tuple(MapComponent.NORTH_ANTS),
+            tuple(MapComponent.SOUTH_ANTS),
+        )
+        if self._recipes_key == key:
+            return self._recipes
+
+        get_sprite = image_cache.get_sprite
+        render_text = self._render_text
+        font24 = self.font24
+        food_overlay = self._get_overlay((248, 232, 187, 191), cell_size)
+        north_overlay = self._get_overlay(MapComponent.NORTH_TEAM_COLOR + (191,), cell_size)
+        south_overlay = self._get_overlay(MapComponent.SOUTH_TEAM_COLOR + (191,), cell_size)
+
+        recipes = []
+        for cell, kind in enumerate(_CELL_KINDS):
+            entries = []
+            add = entries.append
+
+            if kind == _KIND_FOOD:
+                if foodpile_info == 1 or foodpile_info == 3:
+                    add((food_overlay, 0, 0, 0))
+
+                sprite = get_sprite("food.png", cell_size)
+                if sprite is not None:
+                    add((sprite[0], 0, 0, sprite[1]))
+
+                if foodpile_info == 2 or foodpile_info == 3:
+                    add((render_text(_CELL_LABELS[cell], font24, BLACK), 5, 5, 0))
+            elif kind == _KIND_NORTH_ANTHILL or kind == _KIND_SOUTH_ANTHILL:
+                # Draw slightly transparent square to denote team color
+                if anthill_info == 1:
+                    add((north_overlay if kind == _KIND_NORTH_ANTHILL else south_overlay, 0, 0, 0))
+                sprite = get_sprite(_CELL_IMAGES[cell], cell_size)
+                if sprite is not None:
+                    add((sprite[0], 0, 0, sprite[1]))
+            elif kind == _KIND_ANT:
+                ant = _CELL_LABELS[cell]
+
+                # Draw slightly transparent square to denote team color
+                if ant_info == 1 or ant_info == 3:
+                    if ant in MapComponent.NORTH_ANTS:
+                        add((north_overlay, 0, 0, 0))
+                    elif ant in MapComponent.SOUTH_ANTS:
+                        add((south_overlay, 0, 0, 0))
+
+                sprite = get_sprite(_CELL_IMAGES[cell], cell_size)
+                if sprite is not None:
+                    add((sprite[0], 0, 0, sprite[1]))
+
+                if ant_info == 2 or ant_info == 3:
+                    add((render_text(ant, font24, BLACK), 5, 5, 0))
+
+            recipes.append(tuple(entries))
+
+        self._recipes_key = key
+        self._recipes = recipes
+        # Labels can spill into the neighbouring cells when cells are smaller than the font
+        self._recipes_fit = all(
+            dx + surface.get_width() <= cell_size and dy + surface.get_height() <= cell_size
+            for entries in recipes
+            for surface, dx, dy, _ in entries
         )
+        return recipes
+
+    def _render_top_bar(
+        self, screen: Union[pygame.Surface, pygame.SurfaceType], x0: int, y0: int, cell_size: int
+    ):
+        """
+        Renders both teams' top bars and the step counter between them.
+
+        Args:
+            screen (Union[pygame.Surface, pygame.SurfaceType]): The pygame surface to render onto.
+            x0 (int): The x-coordinate on `screen` of the component's top-left corner.
+            y0 (int): The y-coordinate on `screen` of the component's top-left corner.
+            cell_size (int): The width and height of each cell, in pixels.  The bar is one cell tall.
+        """
+        try:
+            screen.blit(self._get_top_bar(cell_size), (x0, y0))
+
+            stepCounter = f"Step {self.simulation.current_map_index + 1} / {len(self.simulation.maps)}"
+            self.draw_string(
+                stepCounter,
+                x0 + self.width // 2,
+                y0 + cell_size // 2,
+                True,
+                self.font32,
+                screen,
+            )
+
+        except TypeError:
+            pass
+
+    def _update_frame(self, previous: Optional[tuple[bytes, ...]]) -> bool:
+        """
+        Brings the cached frame up to date by redrawing only the cells that differ from the previous board.
+
+        Consecutive steps usually move a handful of ants and food, so this replaces re-rendering every occupied
+        cell with redrawing the changed ones from the background layer, plus the top bar.  It only applies when
+        the frame was last rendered with the same layout and settings, the walls are unchanged and no cell's
+        contents spill into its neighbours.
+
+        Args:
+            previous (Optional[tuple[bytes, ...]]): The board the cached frame was rendered from.
+
+        Returns:
+            bool: True if the frame was updated, False if it needs to be rendered from scratch instead.
+        """
+        board = self.map_data
+        if (
+            previous is None
+            or previous is BLANK_BOARD
+            or board is BLANK_BOARD
+            or len(previous) != len(board)
+            or len(previous[0]) != len(board[0])
+        ):
+            return False
+
+        settings = self.simulation.settings
+        cell_size = settings["cellSize"]
+        recipes = self._get_cell_recipes(cell_size)
+        if not self._recipes_fit or self._get_map_cells()[2] != self._background_walls:
+            return False
+
+        frame = self._frame
+        y_top = 0
+        if settings["showTopBar"]:
+            y_top = cell_size
+            # Keep the step counter from spilling onto the first row, which the full render paints over
+            frame.set_clip((0, 0, self.width, cell_size))
+            frame.fill(BLACK)
+            self._render_top_bar(frame, 0, 0, cell_size)
+            frame.set_clip(None)
+
+        rows, cols = len(board), len(board[0])
+        cell_rects = self._get_cell_rects(rows, cols, cell_size, 0, y_top)
+        background = self._background
+        border = self._get_cell_border(cell_size)
+        batch = []
+        add = batch.append
+        for row_idx, (old_row, new_row) in enumerate(zip(previous, board)):
+            if old_row == new_row:
+                continue
+            for col_idx, (old_cell, cell) in enumerate(zip(old_row, new_row)):
+                if old_cell == cell:
+                    continue
+                cell_rect = cell_rects[row_idx * cols + col_idx]
+                topleft = cell_rect.topleft
+                add((background, topleft, (col_idx * cell_size, row_idx * cell_size, cell_size, cell_size)))
+                entries = recipes[cell]
+                if entries:
+                    left, top = topleft
+                    for surface, dx, dy, flags in entries:
+                        add((surface, (left + dx, top + dy), None, flags))
+                    add((border, topleft))
+        frame.blits(batch, doreturn=False)
+        return True
+
+    def _render_map(self, screen: Union[pygame.Surface, pygame.SurfaceType], x0: int, y0: int):
+        """
+        Renders the top bar and every map cell, without the hover overlay or tooltip.
+
+        Args:
+            screen (Union[pygame.Surface, pygame.SurfaceType]): The pygame surface to render onto.
+            x0 (int): The x-coordinate on `screen` of the component's top-left corner.
+            y0 (int): The y-coordinate on `screen` of the component's top-left corner.
+        """
+        # Bind settings and frequently used callables once, outside the per-cell loop
+        settings = self.simulation.settings
+        cell_size = settings["cellSize"]
+        fancy = settings["fancyGraphics"]
+        blit = screen.blit
+
+        show_top_bar = self.map_data is not BLANK_BOARD and settings["showTopBar"]
+        cell_offset = 1 if show_top_bar else 0
+        y_top = y0 + cell_offset * cell_size
 
         # Render top bar
-        if self.map_data is not BLANK_MAP and self.simulation.settings["showTopBar"]:
-            try:
-                self.render_top_bar_north_team(screen)
-                self.render_top_bar_south_team(screen)
-
-                stepCounter = f"Step {self.simulation.current_map_index + 1} / {len(self.simulation.maps)}"
-                self.draw_string(
-                    stepCounter,
-                    self.x + self.width // 2,
-                    self.y + self.simulation.settings["cellSize"] // 2,
-                    True,
-                    self.font32,
-                    screen,
-                )
+        if show_top_bar:
+            self._render_top_bar(screen, x0, y0, cell_size)
 
-            except TypeError:
-                pass
+        rows, cols = len(self.map_data), len(self.map_data[0])
+        cell_offsets, cell_values, wall_cells = self._get_map_cells()
 
-        # Get mouse position
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        hovered_cell = None
-
-        # Render cells
-        for row_idx, row in enumerate(self.map_data):
-            for col_idx, char in enumerate(row):
-                cell_rect = pygame.Rect(
-                    self.x + col_idx * self.simulation.settings["cellSize"],
-                    self.y
-                    + (row_idx + cell_offset) * self.simulation.settings["cellSize"],
-                    self.simulation.settings["cellSize"],
-                    self.simulation.settings["cellSize"],
-                )
+        # Render the static layer (floor, grid and walls).  Empty cells have nothing else on them, so the loop
+        # below only visits the cells with food, anthills or ants.
+        blit(self._get_background_layer(rows, cols, cell_size, fancy, wall_cells), (x0, y_top))
 
-                # Check if the cell is hovered
-                if cell_rect.collidepoint(mouse_x, mouse_y):
-                    hovered_cell = (cell_rect, char, row_idx, col_idx)
-
-                # Fancy Graphics
-                if self.simulation.settings["fancyGraphics"]:
-                    # Grass
-                    if row_idx % 4 == 0 and col_idx % 4 == 0:
-                        grass_rect = pygame.Rect(
-                            self.x + col_idx * self.simulation.settings["cellSize"],
-                            self.y
-                            + (row_idx + cell_offset)
-                            * self.simulation.settings["cellSize"],
-                            self.simulation.settings["cellSize"] * 4,
-                            self.simulation.settings["cellSize"] * 4,
-                        )
-                        image_path = os.path.join("./antcode_ui/images", "empty.png")
-                        if os.path.exists(image_path):
-                            image = pygame.image.load(image_path)
-                            image = pygame.transform.scale(
-                                image,
-                                (
-                                    self.simulation.settings["cellSize"] * 4,
-                                    self.simulation.settings["cellSize"] * 4,
-                                ),
-                            )
-                            screen.blit(image, grass_rect.topleft)
-
-                    # Walls
-                    if char == "#":
-                        image_path = os.path.join(
-                            "./antcode_ui/images",
-                            "wall.png",
-                        )
-                        if os.path.exists(image_path):
-                            image = pygame.image.load(image_path)
-                            image = pygame.transform.scale(
-                                image,
-                                (
-                                    self.simulation.settings["cellSize"],
-                                    self.simulation.settings["cellSize"],
-                                ),
-                            )
-                            screen.blit(image, cell_rect.topleft)
-                else:
-                    pygame.draw.rect(screen, COLORS.get(char, WHITE), cell_rect)
-
-                if char.isdigit():
-                    if (
-                        self.simulation.settings["foodpileInfo"] == 1
-                        or self.simulation.settings["foodpileInfo"] == 3
-                    ):
-                        overlay = pygame.Surface(
-                            (cell_rect.width, cell_rect.height), pygame.SRCALPHA
-                        )
-                        overlay.fill((248, 232, 187, 191))
-                        screen.blit(overlay, cell_rect.topleft)
-
-                    image_path = os.path.join("./antcode_ui/images", "food.png")
-                    if os.path.exists(image_path):
-                        image = pygame.image.load(image_path).convert_alpha()
-                        image = pygame.transform.scale(
-                            image,
-                            (
-                                self.simulation.settings["cellSize"],
-                                self.simulation.settings["cellSize"],
-                            ),
-                        )
-                        screen.blit(image, cell_rect.topleft)
-
-                    if (
-                        self.simulation.settings["foodpileInfo"] == 2
-                        or self.simulation.settings["foodpileInfo"] == 3
-                    ):
-                        self.draw_string(
-                            char,
-                            cell_rect.left + 5,
-                            cell_rect.top + 5,
-                            False,
-                            self.font24,
-                            screen,
-                            BLACK,
-                        )
-                elif char == "@" or char == "X":
-                    # Draw slightly transparent square to denote team color
-                    if self.simulation.settings["anthillInfo"] == 1:
-                        if char == "@":
-                            overlay = pygame.Surface(
-                                (cell_rect.width, cell_rect.height), pygame.SRCALPHA
-                            )
-                            overlay.fill(MapComponent.NORTH_TEAM_COLOR + (191,))
-                            screen.blit(overlay, cell_rect.topleft)
-                        elif char == "X":
-                            overlay = pygame.Surface(
-                                (cell_rect.width, cell_rect.height), pygame.SRCALPHA
-                            )
-                            overlay.fill(MapComponent.SOUTH_TEAM_COLOR + (191,))
-                            screen.blit(overlay, cell_rect.topleft)
-                    image_path = os.path.join(
-                        "./antcode_ui/images",
-                        f"{'north' if char == '@' else 'south'}.png",
-                    )
-                    if os.path.exists(image_path):
-                        image = pygame.image.load(image_path)
-                        image = pygame.transform.scale(
-                            image,
-                            (
-                                self.simulation.settings["cellSize"],
-                                self.simulation.settings["cellSize"],
-                            ),
-                        )
-                        screen.blit(image, cell_rect.topleft)
-                else:
-                    if char.isalpha() and char.upper() in "ABCDEFGHIJ":
-                        # Draw slightly transparent square to denote team color
-                        if (
-                            self.simulation.settings["antInfo"] == 1
-                            or self.simulation.settings["antInfo"] == 3
-                        ):
-                            if char.upper() in MapComponent.NORTH_ANTS:
-                                overlay = pygame.Surface(
-                                    (cell_rect.width, cell_rect.height), pygame.SRCALPHA
-                                )
-                                overlay.fill(MapComponent.NORTH_TEAM_COLOR + (191,))
-                                screen.blit(overlay, cell_rect.topleft)
-                            elif char.upper() in MapComponent.SOUTH_ANTS:
-                                overlay = pygame.Surface(
-                                    (cell_rect.width, cell_rect.height), pygame.SRCALPHA
-                                )
-                                overlay.fill(MapComponent.SOUTH_TEAM_COLOR + (191,))
-                                screen.blit(overlay, cell_rect.topleft)
-
-                        image_path = os.path.join(
-                            "./antcode_ui/images",
-                            f"ant-{char.lower()}{'-food' if char.islower() else ''}.png",
-                        )
-                        if os.path.exists(image_path):
-                            image = pygame.image.load(image_path)
-                            image = pygame.transform.scale(
-                                image,
-                                (
-                                    self.simulation.settings["cellSize"],
-                                    self.simulation.settings["cellSize"],
-                                ),
-                            )
-                            screen.blit(image, cell_rect.topleft)
-
-                        if (
-                            self.simulation.settings["antInfo"] == 2
-                            or self.simulation.settings["antInfo"] == 3
-                        ):
-                            self.draw_string(
-                                char.upper(),
-                                cell_rect.left + 5,
-                                cell_rect.top + 5,
-                                False,
-                                self.font24,
-                                screen,
-                                BLACK,
-                            )
-
-                if char != "#":
-                    pygame.draw.rect(screen, (100, 100, 100), cell_rect, 1)
+        # Render non-empty cells.  Their overlays, images and labels are collected in drawing order, followed by
+        # each cell's border drawn back over its contents, and blitted with a single call.
+        cell_rects = self._get_cell_rects(rows, cols, cell_size, x0, y_top)
+
+        # Cull cells outside the target's clip area.  The window is normally sized to fit the whole map, in which
+        # case every cell is visible and the list is used as is.
+        clip = screen.get_clip()
+        row_min = max(0, (clip.top - y_top) // cell_size)
+        row_max = min(rows, (clip.bottom - 1 - y_top) // cell_size + 1)
+        col_min = max(0, (clip.left - x0) // cell_size)
+        col_max = min(cols, (clip.right - 1 - x0) // cell_size + 1)
+        if row_min > 0 or col_min > 0 or row_max < rows or col_max < cols:
+            # The offsets are sorted, so each visible row's cells are one contiguous span found by bisection,
+            # rather than testing every cell's row and column
+            spans = [
+                (bisect_left(cell_offsets, row * cols + col_min), bisect_left(cell_offsets, row * cols + col_max))
+                for row in range(row_min, row_max)
+            ]
+            cell_offsets = [offset for start, end in spans for offset in cell_offsets[start:end]]
+            cell_values = b"".join([cell_values[start:end] for start, end in spans])
+
+        recipes = self._get_cell_recipes(cell_size)
+        batch = []
+        add = batch.append
+        for offset, cell in zip(cell_offsets, cell_values):
+            left, top = cell_rects[offset].topleft
+            for surface, dx, dy, flags in recipes[cell]:
+                add((surface, (left + dx, top + dy), None, flags))
+
+        border = self._get_cell_border(cell_size)
+        batch.extend([(border, cell_rects[offset].topleft) for offset in cell_offsets])
+        screen.blits(batch, doreturn=False)
+
+    def _get_frame(self) -> pygame.Surface:
+        """
+        Returns an off-screen surface holding the rendered map for the current step.
+
+        Between steps, and whenever playback is paused, consecutive frames are identical apart from the hover
+        overlay and tooltip, so the map is only re-rendered when the board, the step or a setting that affects
+        rendering changes.
+
+        Returns:
+            pygame.Surface: A surface the size of the component with the current map rendered onto it.
+        """
+        settings = self.simulation.settings
+        key = (
+            self.simulation.current_map_index,
+            settings["cellSize"],
+            settings["fancyGraphics"],
+            settings["showTopBar"],
+            settings["foodpileInfo"],
+            settings["antInfo"],
+            settings["anthillInfo"],
+            self.simulation.has_five_ants,
+            self.width,
+            self.height,
+        )
+        if self._frame_source is not self.map_data or self._frame_key != key:
+            # Stepping with unchanged settings only needs the changed cells redrawn
+            same_layout = self._frame is not None and self._frame_key is not None and self._frame_key[1:] == key[1:]
+            if not (same_layout and self._update_frame(self._frame_source)):
+                if self._frame is None or self._frame.get_size() != (self.width, self.height):
+                    self._frame = pygame.Surface((self.width, self.height)).convert()
+                self._frame.fill(BLACK)
+                self._render_map(self._frame, 0, 0)
+            self._frame_source = self.map_data
+            self._frame_key = key
+            self._frame_version += 1
+        return self._frame
+
+    def cell_at(self, x: int, y: int) -> Optional[tuple[int, int]]:
+        """
+        Finds the map cell under a point on the screen.
+
+        The cells form a uniform grid, so the point is divided down to grid coordinates instead of being tested
+        against each cell's rectangle.
+
+        Args:
+            x (int): The x-coordinate of the point on the screen.
+            y (int): The y-coordinate of the point on the screen.
+
+        Returns:
+            Optional[tuple[int, int]]: The (row, column) of the cell under the point, or None if the point is
+                outside the grid.
+        """
+        settings = self.simulation.settings
+        cell_size = settings["cellSize"]
+        y_top = self.y + (cell_size if self.map_data is not BLANK_BOARD and settings["showTopBar"] else 0)
+        row = (y - y_top) // cell_size
+        col = (x - self.x) // cell_size
+        if 0 <= row < len(self.map_data) and 0 <= col < len(self.map_data[row]):
+            return row, col
+        return None
+
+    def draw(self, screen: Union[pygame.Surface, pygame.SurfaceType]):
+        """
+        Draws the map on the given screen surface with interactive hover effects and tooltips.
+
+        The whole map is only copied to the screen when it was re-rendered or the component is dirty.  Otherwise the
+        screen still shows the same frame, and only the previous hover overlay and tooltip are painted over with it
+        before the new ones are drawn; `get_dirty_rects` returns the areas that changed.
+
+        Args:
+            screen (Union[pygame.Surface, pygame.SurfaceType]): The pygame surface to which the map will be drawn.
+        """
+        settings = self.simulation.settings
+        cell_size = settings["cellSize"]
+
+        frame = self._get_frame()
+        area = pygame.Rect(self.x, self.y, self.width, self.height)
+        if self.dirty or self._drawn_frame_version != self._frame_version:
+            screen.blit(frame, area)
+            self.dirty = False
+            self._drawn_frame_version = self._frame_version
+            dirty_rects = [area]
+        else:
+            dirty_rects = self._hover_rects
+            for rect in dirty_rects:
+                screen.blit(frame, rect, rect.move(-self.x, -self.y))
+        hover_rects = self._hover_rects = []
+        self._dirty_rects = dirty_rects
+
+        # Nothing reacts to the mouse with both hover features off, so skip querying it
+        hover_overlay = settings["hoverOverlay"]
+        tooltips = settings["tooltips"]
+        if not (hover_overlay or tooltips):
+            return
 
         # Render hovered cell overlay and tooltip
-        keys = pygame.key.get_pressed()
-        if hovered_cell and pygame.mouse.get_focused():
-            cell_rect, char, cell_x, cell_y = hovered_cell
-
-            if self.simulation.settings["hoverOverlay"]:
-                # Draw semi-transparent overlay
-                overlay = pygame.Surface(
-                    (cell_rect.width, cell_rect.height), pygame.SRCALPHA
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        hovered_cell = self.cell_at(mouse_x, mouse_y)
+        if hovered_cell is not None and pygame.mouse.get_focused():
+            cell_x, cell_y = hovered_cell
+            char = chr(self.map_data[cell_x][cell_y])
+
+            if hover_overlay:
+                # Draw semi-transparent overlay, white with 50% opacity
+                y_top = self.y + (cell_size if self.map_data is not BLANK_BOARD and settings["showTopBar"] else 0)
+                hover_rects.append(
+                    screen.blit(
+                        self._get_overlay((255, 255, 255, 128), cell_size),
+                        (self.x + cell_y * cell_size, y_top + cell_x * cell_size),
+                    ).clip(area)
                 )
-                overlay.fill((255, 255, 255, 128))  # White with 50% opacity
-                screen.blit(overlay, cell_rect.topleft)
 
-            if (
-                self.simulation.settings["tooltips"] == 1
-                and (keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT])
-            ) or self.simulation.settings["tooltips"] == 2:
+            # Tooltips are always shown in mode 2; only mode 1 (hold shift) needs the keyboard state
+            show_tooltip = tooltips == 2
+            if tooltips == 1:
+                keys = pygame.key.get_pressed()
+                show_tooltip = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
+            if show_tooltip:
                 # Tooltip position adjustment
                 tooltip_text = [f"Cell ({cell_x}, {cell_y})"]
                 if char == "#":
@@ -550,12 +991,12 @@ class MapComponent(Component):
                 elif char == "@":
                     tooltip_text.append("North Ant Hill")
                     tooltip_text.append(
-                        f"Score: {self.simulation.maps[self.simulation.current_map_index].north_points}"
+                        f"Score: {self.simulation.maps.north_points[self.simulation.current_map_index]}"
                     )
                 elif char == "X":
                     tooltip_text.append("South Ant Hill")
                     tooltip_text.append(
-                        f"Score: {self.simulation.maps[self.simulation.current_map_index].south_points}"
+                        f"Score: {self.simulation.maps.south_points[self.simulation.current_map_index]}"
                     )
                 elif char.isalpha() and char.upper() in "ABCDEFGHIJ":
                     team = "North Team" if char.upper() in f"ABCD{'E' if self.simulation.has_five_ants else ''}" else "South Team"
@@ -563,13 +1004,8 @@ class MapComponent(Component):
                     if char in "abcdefghij":
                         tooltip_text.append("Holding food")
 
-                tooltip_font = pygame.font.Font(None, 24)
-
                 # Render each line of the tooltip
-                rendered_lines = [
-                    tooltip_font.render(line, True, (255, 255, 255))
-                    for line in tooltip_text
-                ]
+                rendered_lines = [self._render_text(line, self.tooltip_font) for line in tooltip_text]
                 line_heights = [line.get_height() for line in rendered_lines]
                 tooltip_width = max(line.get_width() for line in rendered_lines)
                 tooltip_height = (
@@ -585,12 +1021,26 @@ class MapComponent(Component):
                     tooltip_y = mouse_y - tooltip_height - 10
 
                 # Draw tooltip background
-                tooltip_bg = pygame.Surface((tooltip_width + 4, tooltip_height + 4))
-                tooltip_bg.fill((0, 0, 0))  # Black background
-                screen.blit(tooltip_bg, (tooltip_x - 2, tooltip_y - 2))
+                hover_rects.append(
+                    screen.fill(
+                        BLACK, (tooltip_x - 2, tooltip_y - 2, tooltip_width + 4, tooltip_height + 4)
+                    ).clip(area)
+                )
 
                 # Draw each line of the tooltip
                 current_y = tooltip_y
                 for line_surface in rendered_lines:
                     screen.blit(line_surface, (tooltip_x, current_y))
                     current_y += line_surface.get_height() + 4
+
+        dirty_rects.extend(hover_rects)
+
+    def get_dirty_rects(self) -> list[pygame.Rect]:
+        """
+        Returns the screen areas changed by the last `draw`.
+
+        Returns:
+            list[pygame.Rect]: The whole component after a full redraw, otherwise the previous and current hover
+                overlay and tooltip areas.
+        """
+        return self._dirty_rects
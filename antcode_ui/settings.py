@@ -1,8 +1,11 @@
 # Standard Library Imports
 import json
+import os
+from contextlib import contextmanager
+from types import MappingProxyType
 
 # Third-Party Imports
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional
 
 
 class AntSettings:
@@ -15,16 +18,19 @@ class AntSettings:
         json_file (str): Path to the JSON file storing the settings.
         data (Dict[str, Any]): A dictionary holding the settings data.
         type_hints (Dict[str, str]): A dictionary holding the expected types for each setting.
+        descriptions (Mapping[str, str]): A read-only mapping of each setting to its description.
         simulationPaused (bool): Indicates whether the simulation is paused or running.
 
     Methods:
+        get(json_file: str) -> AntSettings: Returns the shared settings for a JSON file.
         __getitem__(key: str) -> Any: Retrieves the value for a given key.
         __setitem__(key: str, value: Any) -> None: Sets the value for a given key and validates its type.
         __delitem__(key: str) -> None: Deletes the key-value pair for a given key.
         __contains__(key: str) -> bool: Checks if a key exists in the settings data.
         __repr__() -> str: Returns a string representation of the settings data.
-        save() -> None: Saves the current settings data and type hints to the JSON file.
-        load() -> None: Loads the settings data and type hints from the JSON file.
+        batch() -> Iterator[AntSettings]: Defers auto-saving until a group of changes is complete.
+        save() -> None: Saves the current settings data to the JSON file.
+        load() -> None: Loads the settings data from the JSON file, taking type hints from the defaults.
         _validate_type(value: Any, expected_type: str) -> bool: Validates if a value matches the expected type.
     """
 
@@ -57,22 +63,101 @@ class AntSettings:
         "anthillInfo": "Control the display of anthill cell info.\n  0. BG disabled\n  1. BG enabled",
     }
 
+    # DEFAULT_SETTINGS split into default values, type hints and integer bounds, so loading starts from ready-made
+    # dicts instead of unpacking each entry
+    _DEFAULT_DATA = {key: setting[0] for key, setting in DEFAULT_SETTINGS.items()}
+    _DEFAULT_TYPES = {key: setting[1] for key, setting in DEFAULT_SETTINGS.items()}
+    _DEFAULT_CONSTRAINTS = {key: setting[2] for key, setting in DEFAULT_SETTINGS.items() if len(setting) > 2}
+
+    # Read-only view of the descriptions, shared by every instance instead of copied into each one
+    descriptions = MappingProxyType(SETTINGS_DESCRIPTIONS)
+
+    # Python type and display name for each type hint
+    _TYPE_MAP = {
+        "bool": bool,
+        "int": int,
+        "float": float,
+        "str": str,
+        "list": list,
+        "dict": dict,
+        "NoneType": type(None),
+    }
+    # Python type each setting must hold, resolved once from its type hint
+    _EXPECTED_TYPES = dict(zip(_DEFAULT_TYPES, map(_TYPE_MAP.__getitem__, _DEFAULT_TYPES.values())))
+    _TYPE_NAME_MAP = {
+        "bool": "boolean",
+        "int": "integer",
+        "float": "float",
+        "str": "string",
+    }
+
+    # Shared instances handed out by get(), keyed by absolute file path
+    _instances: Dict[str, "AntSettings"] = {}
+
+    @classmethod
+    def get(cls, json_file: str) -> "AntSettings":
+        """
+        Returns the shared settings for the given JSON file, creating them on first use.
+
+        Every caller asking for the same file gets the same object, so the file is loaded once and changes made in
+        one place are seen, and saved, by all of them.
+
+        Args:
+            json_file (str): Path to the JSON file used to store the settings.
+
+        Returns:
+            AntSettings: The settings stored in that file.
+        """
+        path = os.path.abspath(json_file)
+        try:
+            return cls._instances[path]
+        except KeyError:
+            settings = cls._instances[path] = cls(json_file)
+            return settings
+
     def __init__(self, json_file: str) -> None:
         """
         Initializes the AntSettings object with the given JSON file.
 
+        The file isn't read until the settings are first used; see `__getattr__`.  Use `get()` to share one instance
+        per file; constructing one directly gives an independent copy.
+
         Args:
             json_file (str): Path to the JSON file used to store the settings.
         """
         self.json_file = json_file
-        self.data: Dict[str, Any] = {}
         self.contraints: Dict[str, Any] = {}
-        self.type_hints: Dict[str, str] = {}
-        self.descriptions: Dict[str, str] = {}
 
         self.simulationPaused = True
 
-        self.load()
+        # Open batch() blocks, and whether a change inside them still needs saving
+        self._batch_depth = 0
+        self._dirty = False
+        # The file's contents as last read or written, so saving unchanged settings doesn't touch the disk
+        self._saved_payload: Optional[bytes] = None
+        # repr() of the data, rebuilt after the next change
+        self._repr_cache: Optional[str] = None
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Loads the settings the first time `data` or `type_hints` is accessed.
+
+        Both attributes are only assigned by `load()`, so until then Python falls back to this method. Afterwards
+        they're plain attributes, and reading settings costs nothing extra.
+
+        Args:
+            name (str): The name of the missing attribute.
+
+        Returns:
+            Any: The attribute's value after loading.
+
+        Raises:
+            AttributeError: If the attribute isn't one that loading provides.
+        """
+        if name in ("data", "type_hints"):
+            self.load()
+            return self.__dict__[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def __getitem__(self, key: str) -> Any:
         """
@@ -115,9 +200,12 @@ class AntSettings:
                         )
 
         self.data[key] = value
+        self._repr_cache = None
 
-        if self.data["autoSave"]:
-            self.save()
+        if key == "autoSave":
+            self._autosave = value
+        if self._autosave:
+            self._auto_save()
 
     def __delitem__(self, key: str) -> None:
         """
@@ -128,9 +216,10 @@ class AntSettings:
         """
         del self.data[key]
         del self.type_hints[key]
+        self._repr_cache = None
 
-        if self.data["autoSave"]:
-            self.save()
+        if self._autosave:
+            self._auto_save()
 
     def __contains__(self, key: str) -> bool:
         """
@@ -148,21 +237,72 @@ class AntSettings:
         """
         Returns a string representation of the settings data.
 
+        The string is kept until the settings next change.
+
         Returns:
             str: String representation of the data dictionary.
         """
-        return repr(self.data)
+        if self._repr_cache is None:
+            self._repr_cache = repr(self.data)
+        return self._repr_cache
+
+    def _auto_save(self) -> None:
+        """
+        Saves the settings after a change, or marks them as needing a save if a batch is open.
+        """
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save()
+
+    @contextmanager
+    def batch(self) -> Iterator["AntSettings"]:
+        """
+        Groups several changes into a single auto-save.
+
+        Changes made inside the block are saved once when the outermost block exits, instead of rewriting the file
+        after each one. Blocks can be nested.
+
+        Yields:
+            AntSettings: This settings object.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self.save()
 
     def save(self) -> None:
         """
-        Saves the current settings data and type hints to the JSON file.
+        Saves the current settings data to the JSON file.
+
+        Only the values are stored; their types always come from `DEFAULT_SETTINGS`. Nothing is written if the file
+        already holds the same settings. Otherwise the settings are written to a temporary file that then replaces
+        the original, so an interrupted save can't leave a truncated file behind.
 
         Raises:
             IOError: If there is an issue writing to the file.
         """
         combined_data = {key: self.data[key] for key in self.data}
-        with open(self.json_file, "w") as file:
-            json.dump(combined_data, file, indent=4)
+        # Serialize up front and write the whole document at once; json.dump writes each token separately
+        payload = json.dumps(combined_data, indent=4).encode("utf-8")
+        if payload == self._saved_payload:
+            return
+
+        temp_file = self.json_file + ".tmp"
+        # Write the bytes straight to the descriptor; the file object's buffering has nothing to batch here
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(temp_file, self.json_file)
+        self._saved_payload = payload
 
     def load(self) -> None:
         """
@@ -170,47 +310,76 @@ class AntSettings:
         If the loading fails (e.g., file not found or invalid JSON),
         the default settings will be applied. It also ensures that if any key is missing
         or if the type of any setting value is invalid, the default values are applied.
+        Settings saved in the older `[value, type]` form are read as their value, and the file is rewritten.
         """
-        try:
-            with open(self.json_file, "r") as file:
-                combined_data = json.load(file)
-                self.data = {}
-                self.type_hints = {}
-
-                for key, (
-                    value,
-                    expected_type,
-                    *optional_constraints,
-                ) in self.DEFAULT_SETTINGS.items():
-                    constraints = (
-                        optional_constraints[0] if optional_constraints else None
-                    )
-                    if key in combined_data:
-                        current_value = combined_data[key]
-                        if self._validate_type(current_value, expected_type):
-                            self.data[key] = current_value
-                            self.type_hints[key] = expected_type
-                        else:
-                            self.data[key] = value
-                            self.type_hints[key] = expected_type
-                    else:
-                        self.data[key] = value
-                        self.type_hints[key] = expected_type
-                    if constraints:
-                        self.contraints[key] = constraints
-
-                self.save()
+        # A missing file is the usual first-run case; check for it up front rather than unwinding from open()
+        if not os.path.isfile(self.json_file):
+            self._apply_defaults()
+            return
 
+        try:
+            with open(self.json_file, "rb") as file:
+                raw_data = file.read()
+            combined_data = json.loads(raw_data)
         except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
-            self.data = {key: value[0] for key, value in self.DEFAULT_SETTINGS.items()}
-            self.type_hints = {
-                key: value[1] for key, value in self.DEFAULT_SETTINGS.items()
-            }
+            self._apply_defaults()
+            return
+        if not isinstance(combined_data, dict):
+            # Valid JSON, but not a settings object
+            self._apply_defaults()
+            return
+
+        # The file is closed again before any rewrite below; Windows can't replace a file that's still open
+        self._saved_payload = raw_data
+        self.data = dict(self._DEFAULT_DATA)
+        self.type_hints = dict(self._DEFAULT_TYPES)
+        # Whether the file needs rewriting: a setting was missing or invalid, or an unknown one was dropped
+        changed = not combined_data.keys() <= self._DEFAULT_DATA.keys()
+
+        for key, expected_type in self._EXPECTED_TYPES.items():
+            if key not in combined_data:
+                changed = True
+                continue
+            current_value = combined_data[key]
+            if (
+                expected_type is not list
+                and isinstance(current_value, list)
+                and len(current_value) >= 2
+                and current_value[1] == self._DEFAULT_TYPES[key]
+            ):
+                # Older files stored each setting as [value, type, ...]; keep the value and rewrite
+                current_value = current_value[0]
+                changed = True
+            # Same check as _validate_type, inlined against the pre-resolved type
+            if isinstance(current_value, expected_type) and not (
+                expected_type is int and isinstance(current_value, bool)
+            ):
+                self.data[key] = current_value
+            else:
+                changed = True
+
+        if changed:
             self.save()
 
-        self.descriptions = {
-            key: value for key, value in self.SETTINGS_DESCRIPTIONS.items()
-        }
+        self._finish_load()
+
+    def _apply_defaults(self) -> None:
+        """
+        Replaces the settings with the defaults and saves them to the JSON file.
+        """
+        self.data = dict(self._DEFAULT_DATA)
+        self.type_hints = dict(self._DEFAULT_TYPES)
+        self.save()
+        self._finish_load()
+
+    def _finish_load(self) -> None:
+        """
+        Sets up the state derived from freshly loaded settings.
+        """
+        self.contraints.update(self._DEFAULT_CONSTRAINTS)
+        self._repr_cache = None
+        # Checked after every change, so kept on an attribute rather than looked up in the data each time
+        self._autosave = self.data["autoSave"]
 
     def get_key_type(self, key: str) -> str:
         """
@@ -222,14 +391,8 @@ class AntSettings:
         Returns:
             str: The resulting type name
         """
-        type_map = {
-            "bool": "boolean",
-            "int": "integer",
-            "float": "float",
-            "str": "string",
-        }
-        if key in self.type_hints and self.type_hints[key] in type_map:
-            return type_map[self.type_hints[key]]
+        if key in self.type_hints and self.type_hints[key] in AntSettings._TYPE_NAME_MAP:
+            return AntSettings._TYPE_NAME_MAP[self.type_hints[key]]
         return "none"
 
     def get_key_description(self, key: str) -> str:
@@ -251,6 +414,8 @@ class AntSettings:
         """
         Validates whether a value matches the expected type.
 
+        Booleans are rejected where an integer is expected, even though `bool` is a subclass of `int`.
+
         Args:
             value (Any): The value to validate.
             expected_type (str): The expected type as a string.
@@ -258,13 +423,6 @@ class AntSettings:
         Returns:
             bool: True if the value matches the expected type, False otherwise.
         """
-        type_map = {
-            "bool": bool,
-            "int": int,
-            "float": float,
-            "str": str,
-            "list": list,
-            "dict": dict,
-            "NoneType": type(None),
-        }
-        return isinstance(value, type_map.get(expected_type, object))
+        if expected_type == "int" and isinstance(value, bool):
+            return False
+        return isinstance(value, AntSettings._TYPE_MAP.get(expected_type, object))
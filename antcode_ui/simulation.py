@@ -1,10 +1,12 @@
 # Standard Library Imports
 import os
 import re
+import signal
+import subprocess
 import sys
 import threading
-from queue import Queue
-from typing import Optional, Tuple
+from queue import Empty, Queue
+from typing import Callable, Iterable, Iterator, Optional, Tuple
 
 # Third-Party Imports
 import pygame
@@ -12,7 +14,7 @@ from PyQt5.QtWidgets import QApplication, QFileDialog
 from colorama import Fore, Back, Style
 
 # Local Imports
-from . import BLACK, VALID_MAP_CHARS, BLANK_MAP
+from . import BLACK, VALID_MAP_CHARS, BLANK_BOARD, BLANK_MAP_SHAPE
 from .base import (
     Command,
     CommandManager,
@@ -21,10 +23,113 @@ from .base import (
     Component,
     Message,
     Round,
+    Rounds,
 )
 from .map import MapComponent
 from .settings import AntSettings
 
+# Event types passed to the components' mouse and keyboard handlers
+_MOUSE_EVENTS = frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION))
+_KEYBOARD_EVENTS = frozenset((pygame.KEYDOWN, pygame.KEYUP))
+# Window events after which the window's contents are gone or stale, so every component is drawn and presented in full
+_EXPOSE_EVENTS = frozenset((pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED))
+# Every event type the simulation reacts to; SDL drops the rest before they reach the event queue.  Besides input,
+# the window events that mean the window must be drawn again, or that the mouse entered or left it, are kept
+_HANDLED_EVENTS = (
+    pygame.QUIT,
+    *_MOUSE_EVENTS,
+    *_KEYBOARD_EVENTS,
+    *_EXPOSE_EVENTS,
+    pygame.WINDOWENTER,
+    pygame.WINDOWLEAVE,
+)
+# Posted by the console thread after queueing a command, so a main loop that's waiting for events wakes up to run it
+_COMMAND_EVENT = pygame.event.custom_type()
+# Longest the main loop waits for an event while idle, which bounds how long Ctrl+C takes to be noticed
+_IDLE_WAIT_MS = 250
+# The event handlers a component can override for each kind of event, keyed by the simulation attribute listing the
+# components that override them; components are only sent the kinds of events they handle
+_EVENT_HANDLER_NAMES = {
+    "event_components": ("handle_event", "handle_events"),
+    "mouse_components": ("handle_mouse_event", "handle_mouse_events"),
+    "keyboard_components": ("handle_keyboard_event", "handle_keyboard_events"),
+}
+# Most queued commands handled per frame; any others wait for the next frame, so drawing is never held up for long
+_COMMANDS_PER_FRAME = 8
+
+# Patterns for the header and per-round lines of a map file, which is parsed as bytes
+_SIZE_RE = re.compile(rb"SIZE (\d+) (\d+)")
+_WINNER_RE = re.compile(rb"WINNER (\w+)")
+_ROUND_RE = re.compile(rb"ROUND (\d+)")
+_NORTH_RE = re.compile(rb"NORTH (\d+)")
+_SOUTH_RE = re.compile(rb"SOUTH (\d+)")
+# Every valid map character; deleting them from a board row must leave nothing behind
+_VALID_MAP_BYTES = "".join(sorted(VALID_MAP_CHARS)).encode("ascii")
+# Byte values of the fifth ant on each team; a row holding both means the game has five ants per team.  Testing a
+# byte value is much cheaper than testing for a one-byte substring
+_ANT_I = ord("I")
+_ANT_J = ord("J")
+
+
+def _parse_count(line: bytes, prefix: bytes, pattern: re.Pattern) -> Optional[int]:
+    """
+    Reads the number from a header line such as "ROUND 12".
+
+    Lines that are just the prefix followed by digits, as every generated map file has them, are sliced and converted
+    directly.  Anything else is searched with the line's pattern, so lines the pattern accepted before still parse.
+
+    Args:
+        line (bytes): The line to read.
+        prefix (bytes): The text before the number, including the trailing space.
+        pattern (re.Pattern): The pattern matching the line, with the number as its first group.
+
+    Returns:
+        Optional[int]: The number, or None if the line doesn't contain one.
+    """
+    if line.startswith(prefix):
+        digits = line[len(prefix):]
+        if digits.isdigit():
+            return int(digits)
+    match = pattern.search(line)
+    return int(match.group(1)) if match else None
+
+
+# The Qt application behind the map file dialog; Qt allows only one per process, so it's created once and reused
+_qt_app: Optional[QApplication] = None
+
+# Separator between the sections of a map file
+_SECTION_SEPARATOR = b"=" * 30
+_SEPARATOR_BYTE = ord("=")
+# Separator between a round's header lines and its board
+_BOARD_SEPARATOR = b"=" * 25
+
+
+def _split_sections(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Splits the lines of a map file into the text between each section separator, as `bytes.split` would.
+
+    Only the current section is kept, so the file never has to be read into memory whole.
+
+    Args:
+        lines (Iterable[bytes]): The lines of the file, with their line endings.
+
+    Returns:
+        Iterator[bytes]: Each section's text, starting with the one before the first separator.
+    """
+    section = []
+    for line in lines:
+        # Most lines have no "=" at all, which is cheap to rule out before searching for the separator
+        if _SEPARATOR_BYTE in line and _SECTION_SEPARATOR in line:
+            parts = line.split(_SECTION_SEPARATOR)
+            section.append(parts[0])
+            yield b"".join(section)
+            for part in parts[1:-1]:
+                yield part
+            section = [parts[-1]]
+        else:
+            section.append(line)
+    yield b"".join(section)
+
 
 class AntSimulation:
     """
@@ -44,7 +149,11 @@ class AntSimulation:
         running (threading.Event): An event to control the simulation loop.
         commands (CommandManager): An object to keep track of all available simulation commands.
         command_queue (Queue): A queue for processing user commands asynchronously.
+        generator_process (Optional[subprocess.Popen]): The running map generator, if any.
         components (list[Component]): A list of visual components that are part of the simulation.
+        event_components (list[Component]): The components that override `handle_event` or `handle_events`.
+        mouse_components (list[Component]): The components that override a mouse event handler.
+        keyboard_components (list[Component]): The components that override a keyboard event handler.
         current_map_index (int): Index of the current map being displayed.
         screen_width (int): Width of the simulation screen.
         screen_height (int): Height of the simulation screen.
@@ -52,10 +161,12 @@ class AntSimulation:
         clock (pygame.time.Clock): Clock for controlling the frame rate of the simulation.
         board_size (Optional[Tuple[int, int]]): Size of the map (rows, columns).
         winner (Optional[str]): Winner of the game
-        maps (Optional[list[Round]]): List of loaded rounds with map data for each round.
+        maps (Optional[Rounds]): The loaded rounds, with the map data for each round.
+        map_count (int): Number of loaded rounds, or 0 if no map is loaded.
         map_component (MapComponent): The component responsible for displaying the map.
         map_switch_interval (int): Interval in milliseconds between automatic map switches.
-        last_map_switch_time (int): The last time the map was switched.
+        time_since_map_switch (int): Milliseconds elapsed since the map was last switched.
+        needs_redraw (bool): Whether the window must be redrawn at the end of the current frame.
 
     Methods:
         reset_screen() -> None:
@@ -80,6 +191,8 @@ class AntSimulation:
             Dispatches a mouse-related event to all components.
         handle_keyboard_event(event: pygame.event.Event) -> None:
             Dispatches a keyboard-related event to all components.
+        handle_events(events: list[pygame.event.Event]) -> None:
+            Dispatches a frame's worth of events to all components in batches.
         exit() -> None:
             Saves settings and exits the simulation.
         run() -> None:
@@ -98,21 +211,37 @@ class AntSimulation:
             len(self.map_component.map_data)
             + (
                 1
-                if self.map_component.map_data is not BLANK_MAP
+                if self.map_component.map_data is not BLANK_BOARD
                 and self.settings["showTopBar"]
                 else 0
             )
         ) * self.settings["cellSize"]
         self.map_component.width = screen_width
         self.map_component.height = screen_height
-        
-        if self.has_five_ants:
+
+        # Recreating the window is slow and makes it flicker, so it's only done when its size changes
+        if self.screen.get_size() != (screen_width, screen_height):
+            self.screen = pygame.display.set_mode((screen_width, screen_height))
+            self.screen.fill(BLACK)
+            # The new window starts out blank, so every component is drawn again in full
+            for component in self.components:
+                component.dirty = True
+        self.needs_redraw = True
+
+    def _set_has_five_ants(self, has_five_ants: bool) -> None:
+        """
+        Record whether the loaded game has five ants per team, and split the ant letters into teams to match.
+
+        Args:
+            has_five_ants (bool): Whether each team has five ants instead of four.
+        """
+        self.has_five_ants = has_five_ants
+        if has_five_ants:
             MapComponent.NORTH_ANTS = ["A", "B", "C", "D", "E"]
             MapComponent.SOUTH_ANTS = ["F", "G", "H", "I", "J"]
         else:
             MapComponent.NORTH_ANTS = ["A", "B", "C", "D"]
             MapComponent.SOUTH_ANTS = ["E", "F", "G", "H"]
-        self.screen = pygame.display.set_mode((screen_width, screen_height))
 
     def add_component(self, component: Component) -> None:
         """
@@ -122,6 +251,10 @@ class AntSimulation:
             component (Component): The component to add.
         """
         self.components.append(component)
+        component_type = type(component)
+        for listeners, names in _EVENT_HANDLER_NAMES.items():
+            if any(getattr(component_type, name) is not getattr(Component, name) for name in names):
+                getattr(self, listeners).append(component)
 
     def load_maps(self) -> None:
         """
@@ -132,106 +265,78 @@ class AntSimulation:
         If loading fails, it falls back to a blank map.
         """
         # Open file dialog to select a map file
-        app = QApplication([])
+        global _qt_app
+        if _qt_app is None:
+            _qt_app = QApplication.instance() or QApplication([])
         options = QFileDialog.Options()
         options |= QFileDialog.ReadOnly
         filename, _ = QFileDialog.getOpenFileName(
             None, "Open File", "", "All Files (*);;Text Files (*.txt)", options=options
         )
 
-        self.has_five_ants = False
+        self._set_has_five_ants(False)
 
         # If no file is selected or the file doesn't exist, reset to blank map
         if not filename or not os.path.exists(filename):
             self.board_size = (None, None)
             self.winner = None
             self.maps = None
+            self.map_count = 0
             self.current_map_index = 0
-            self.map_component.map_data = BLANK_MAP
+            self.map_component.map_data = BLANK_BOARD
             self.reset_screen()
             return
 
-        rounds = []
+        rounds = Rounds()
         board_size = None
         winner = None
 
         try:
-            # Read file content
-            with open(filename, "r") as file:
-                content = file.read()
-
-            # Split file content into sections using "============================"
-            sections = content.split("=" * 30)
-
-            # Extract board size from the first section
-            first_section = sections[0].strip()
-            size_match = re.search(r"SIZE (\d+) (\d+)", first_section)
-
-            if size_match:
-                rows, cols = map(int, size_match.groups())
-                board_size = (rows, cols)
-            else:
-                raise ValueError("Board size not found.")
+            # Map files are plain ASCII, so they're parsed as bytes rather than decoded; board rows are kept as bytes
+            with open(filename, "rb") as file:
+                # Sections are read one at a time, so only the current round's text is held in memory
+                sections = _split_sections(file)
+
+                # Extract board size from the first section
+                first_section = next(sections)
+                size_match = _SIZE_RE.search(first_section.strip())
+
+                if size_match:
+                    rows, cols = map(int, size_match.groups())
+                    board_size = (rows, cols)
+                else:
+                    raise ValueError("Board size not found.")
+
+                # Process each round's data.  The winner is in the last section, which is only known once the file
+                # has been read; it's checked before any round error is reported, as when the file was split up front
+                last_section = first_section
+                round_error = None
+                has_five_ants = False
+                for section in sections:
+                    last_section = section
+                    if round_error is not None:
+                        continue
+                    try:
+                        round_obj = self._parse_round(section, board_size)
+                    except ValueError as e:
+                        round_error = e
+                        continue
+                    if round_obj is not None:
+                        rounds.append(round_obj)
+                        if not has_five_ants:
+                            has_five_ants = any(_ANT_I in row and _ANT_J in row for row in round_obj.board)
 
             # Extract winner from the last section
-            last_section = sections[len(sections) - 1].strip()
-            winner_match = re.search(r"WINNER (\w+)", last_section)
+            winner_match = _WINNER_RE.search(last_section.strip())
 
             if winner_match:
-                winner = winner_match.group(1)
+                winner = winner_match.group(1).decode("ascii")
             else:
                 raise ValueError("Winner not found.")
 
-            # Process each round's data
-            for section in sections[1:]:
-                stripped = section.strip()
-                lines = stripped.split("\n")
-
-                # Skip empty sections and those that are missing lines
-                if stripped == "" or not len(lines) == 4 + board_size[0]:
-                    continue
-
-                # Extract round number
-                round_match = re.search(r"ROUND (\d+)", lines[0])
-                if round_match:
-                    round_number = int(round_match.group(1))
-                else:
-                    raise ValueError(f"Round number not found in section: {section}")
-
-                # Extract team scores
-                north_match = re.search(r"NORTH (\d+)", lines[1])
-                south_match = re.search(r"SOUTH (\d+)", lines[2])
-
-                if north_match and south_match:
-                    north_points = int(north_match.group(1))
-                    south_points = int(south_match.group(1))
-                else:
-                    raise ValueError(f"Team points not found in section: {section}")
-
-                try:
-                    # Locate board data within the section
-                    board_start_idx = lines.index("=" * 25) + 1
-                    board = lines[board_start_idx : board_start_idx + board_size[0]]
-
-                    # Validate board dimensions and characters
-                    for line in board:
-                        if len(line) != board_size[1] or not set(line).issubset(
-                            VALID_MAP_CHARS
-                        ):
-                            raise ValueError(
-                                f"Invalid map format or invalid characters detected: {line}"
-                            )
-                        if {'I', 'J'} <= set(line): # Board has five ants]
-                            self.has_five_ants = True
-
-                except ValueError:
-                    raise ValueError(
-                        f"Valid board data not found in section: {section}"
-                    )
-
-                # Store the parsed round data
-                round_obj = Round(round_number, north_points, south_points, board)
-                rounds.append(round_obj)
+            self._set_has_five_ants(has_five_ants)
+            if round_error is not None:
+                raise round_error
 
             # Ensure exactly 200 rounds exist
             if not len(rounds) == 200:
@@ -244,8 +349,9 @@ class AntSimulation:
             self.board_size = board_size
             self.winner = winner
             self.maps = rounds
+            self.map_count = len(rounds)
             self.current_map_index = 0
-            self.map_component.map_data = self.maps[self.current_map_index].board
+            self.map_component.map_data = self.maps.boards[self.current_map_index]
             self.reset_screen()
         except ValueError as e:
             # Handle errors by resetting to a blank map
@@ -254,23 +360,83 @@ class AntSimulation:
             self.board_size = (None, None)
             self.winner = None
             self.maps = None
-            self.map_component.map_data = BLANK_MAP
+            self.map_count = 0
+            self.map_component.map_data = BLANK_BOARD
             self.reset_screen()
 
+    @staticmethod
+    def _parse_round(section: bytes, board_size: Tuple[int, int]) -> Optional[Round]:
+        """
+        Parse one round's section of a map file.
+
+        Args:
+            section (bytes): The section's text, between two "==============================" separators.
+            board_size (Tuple[int, int]): The size of the map (rows, columns).
+
+        Returns:
+            Optional[Round]: The parsed round, or None for empty sections and those that are missing lines.
+
+        Raises:
+            ValueError: If the section's round number, team points or board data are invalid.
+        """
+        stripped = section.strip()
+        # Also splits on Windows line endings, which reading the file in text mode used to translate
+        lines = stripped.splitlines()
+
+        # Skip empty sections and those that are missing lines
+        if stripped == b"" or not len(lines) == 4 + board_size[0]:
+            return None
+
+        # Extract round number
+        round_number = _parse_count(lines[0], b"ROUND ", _ROUND_RE)
+        if round_number is None:
+            raise ValueError(f"Round number not found in section: {section.decode(errors='replace')}")
+
+        # Extract team scores
+        north_points = _parse_count(lines[1], b"NORTH ", _NORTH_RE)
+        south_points = _parse_count(lines[2], b"SOUTH ", _SOUTH_RE)
+
+        if north_points is None or south_points is None:
+            raise ValueError(f"Team points not found in section: {section.decode(errors='replace')}")
+
+        try:
+            # Locate board data within the section.  It normally follows the three header lines, which can't be the
+            # separator themselves since they parsed, so the section is only searched when it's somewhere else
+            if lines[3] == _BOARD_SEPARATOR:
+                board_start_idx = 4
+            else:
+                board_start_idx = lines.index(_BOARD_SEPARATOR) + 1
+            board = lines[board_start_idx : board_start_idx + board_size[0]]
+
+            # Validate board dimensions and characters
+            for line in board:
+                if len(line) != board_size[1] or line.translate(None, _VALID_MAP_BYTES):
+                    raise ValueError(
+                        f"Invalid map format or invalid characters detected: {line.decode(errors='replace')}"
+                    )
+
+        except ValueError:
+            raise ValueError(
+                f"Valid board data not found in section: {section.decode(errors='replace')}"
+            )
+
+        return Round(round_number, north_points, south_points, board)
+
     def skip_start(self) -> None:
         """
         Reset the simulation to the first step.
 
         If the simulation is configured to pause on step changes, it will pause.
         """
-        if self.maps is None or len(self.maps) == 0:
+        if not self.map_count:
             return
 
-        if self.settings["pauseOnStep"]:
-            self.settings.simulationPaused = True
+        settings = self.settings
+        if settings["pauseOnStep"]:
+            settings.simulationPaused = True
 
         self.current_map_index = 0
-        self.map_component.map_data = self.maps[self.current_map_index].board
+        self.map_component.map_data = self.maps.boards[self.current_map_index]
 
     def step_backward(self) -> None:
         """
@@ -279,26 +445,25 @@ class AntSimulation:
         Wraps around to the last step if already at the beginning.
         Pauses the simulation if configured to do so on step changes.
         """
-        if self.maps is None or len(self.maps) == 0:
+        if not self.map_count:
             return
 
-        if self.settings["pauseOnStep"]:
-            self.settings.simulationPaused = True
+        settings = self.settings
+        if settings["pauseOnStep"]:
+            settings.simulationPaused = True
 
-        self.current_map_index = (self.current_map_index - 1) % len(self.maps)
-        self.map_component.map_data = self.maps[self.current_map_index].board
+        map_index = self.current_map_index
+        self.current_map_index = map_index - 1 if map_index else self.map_count - 1
+        self.map_component.map_data = self.maps.boards[self.current_map_index]
 
     def play_pause(self) -> None:
         """
         Toggle the simulation playback state between paused and playing.
         """
-        if self.maps is None or len(self.maps) == 0:
+        if not self.map_count:
             return
 
-        if self.settings.simulationPaused:
-            self.settings.simulationPaused = False
-        else:
-            self.settings.simulationPaused = True
+        self.settings.simulationPaused = not self.settings.simulationPaused
 
     def step_forward(self) -> None:
         """
@@ -307,14 +472,16 @@ class AntSimulation:
         Wraps around to the first step if already at the end.
         Pauses the simulation if configured to do so on step changes.
         """
-        if self.maps is None or len(self.maps) == 0:
+        if not self.map_count:
             return
 
-        if self.settings["pauseOnStep"]:
-            self.settings.simulationPaused = True
+        settings = self.settings
+        if settings["pauseOnStep"]:
+            settings.simulationPaused = True
 
-        self.current_map_index = (self.current_map_index + 1) % len(self.maps)
-        self.map_component.map_data = self.maps[self.current_map_index].board
+        map_index = self.current_map_index + 1
+        self.current_map_index = 0 if map_index >= self.map_count else map_index
+        self.map_component.map_data = self.maps.boards[self.current_map_index]
 
     def skip_end(self) -> None:
         """
@@ -322,60 +489,281 @@ class AntSimulation:
 
         If the simulation is set to pause on step changes, it will pause.
         """
-        if self.maps is None or len(self.maps) == 0:
+        if not self.map_count:
             return
 
-        if self.settings["pauseOnStep"]:
-            self.settings.simulationPaused = True
+        settings = self.settings
+        if settings["pauseOnStep"]:
+            settings.simulationPaused = True
 
-        self.current_map_index = len(self.maps) - 1
-        self.map_component.map_data = self.maps[self.current_map_index].board
+        self.current_map_index = self.map_count - 1
+        self.map_component.map_data = self.maps.boards[self.current_map_index]
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """
-        Dispatch a general event to all components.
+        Dispatch a general event to the components that handle events.
 
         Args:
             event (pygame.event.Event): The event to handle.
         """
-        for component in self.components:
+        for component in self.event_components:
             component.handle_event(event)
 
     def handle_mouse_event(self, event: pygame.event.Event) -> None:
         """
-        Dispatch a mouse-related event to all components.
+        Dispatch a mouse-related event to the components that handle mouse events.
 
         Args:
             event (pygame.event.Event): The mouse event to handle.
         """
-        if event.type in [
-            pygame.MOUSEBUTTONDOWN,
-            pygame.MOUSEBUTTONUP,
-            pygame.MOUSEMOTION,
-        ]:
-            for component in self.components:
+        if event.type in _MOUSE_EVENTS:
+            for component in self.mouse_components:
                 component.handle_mouse_event(event)
 
     def handle_keyboard_event(self, event: pygame.event.Event) -> None:
         """
-        Dispatch a keyboard-related event to all components.
+        Dispatch a keyboard-related event to the components that handle keyboard events.
 
         Args:
             event (pygame.event.Event): The keyboard event to handle.
         """
-        if event.type in [pygame.KEYDOWN, pygame.KEYUP]:
-            for component in self.components:
+        if event.type in _KEYBOARD_EVENTS:
+            for component in self.keyboard_components:
                 component.handle_keyboard_event(event)
 
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        """
+        Dispatch the events polled in one frame to all components.
+
+        The events are sorted into mouse and keyboard events once, and each component receives each group in a single
+        call instead of being called three times per event.  Each group only goes to the components that override
+        its handlers, and is only sorted out when there are any.
+
+        Args:
+            events (list[pygame.event.Event]): The events to handle, not including QUIT.
+        """
+        if not events:
+            return
+        if self.mouse_components:
+            mouse_events = [event for event in events if event.type in _MOUSE_EVENTS]
+            if mouse_events:
+                for component in self.mouse_components:
+                    component.handle_mouse_events(mouse_events)
+        if self.keyboard_components:
+            keyboard_events = [event for event in events if event.type in _KEYBOARD_EVENTS]
+            if keyboard_events:
+                for component in self.keyboard_components:
+                    component.handle_keyboard_events(keyboard_events)
+        for component in self.event_components:
+            component.handle_events(events)
+
+    def _handle_message(self, message: Message) -> None:
+        """
+        Run the handler for a message queued by the console thread.
+
+        Args:
+            message (Message): The queued message.
+        """
+        command = message.message
+        self.needs_redraw = True
+
+        handler = self._command_handlers.get(command)
+        if handler is not None:
+            handler(message)
+        elif self.maps is None:
+            print(
+                f"{Fore.LIGHTRED_EX}No map is currently loaded{Fore.RESET}"
+            )
+        else:
+            handler = self._map_command_handlers.get(command)
+            if handler is not None:
+                handler(message)
+
+    def _print_step(self) -> None:
+        """
+        Print the current step out of the total number of steps.
+        """
+        step = self.current_map_index + 1
+        map_count = self.map_count
+        color = Fore.YELLOW if step == map_count else Fore.GREEN
+        print(f"Step: {color}{step}{Fore.RESET} / {Fore.YELLOW}{map_count}{Fore.RESET}")
+
+    def _handle_generate(self, message: Message) -> None:
+        """
+        Start the original text-based Antcode simulation to generate new maps.
+
+        The generator runs in its own process, so the window keeps drawing and handling input meanwhile.  The console
+        waits for it to exit before prompting again, so the two never read the terminal at the same time.
+
+        The terminal sends Ctrl+C to the generator and the UI alike, so the UI ignores it until the generator exits,
+        as it did while the generator ran in the foreground.  The signal is only ignored after the generator has
+        started, since ignored signals are inherited by child processes.
+
+        Args:
+            message (Message): The queued "generate" message.
+        """
+        print(Style.NORMAL)
+        self.generator_process = subprocess.Popen([sys.executable, "./antcode/main.py"])
+        if self._sigint_handler is None:
+            self._sigint_handler = signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    def _handle_config(self, message: Message) -> None:
+        """
+        Apply a setting change queued by the config command.
+
+        Args:
+            message (Message): The queued "config" message, holding the setting's key and new value.
+        """
+        try:
+            self.settings[message.data[0]] = message.data[1]
+            print(
+                f"Updated {Style.DIM}'{message.data[0]}'{Style.NORMAL} to {Fore.GREEN}'{message.data[1]}'{Fore.RESET}"
+            )
+
+            if (
+                message.data[0] == "cellSize"
+                or message.data[0] == "showTopBar"
+            ):
+                self.reset_screen()
+            elif message.data[0] == "stepsPerSecond":
+                self.map_switch_interval = (
+                    1000 // self.settings["stepsPerSecond"]
+                )
+        except TypeError as e:
+            print(f"{Fore.LIGHTRED_EX}{e}{Fore.RESET}")
+
+    def _handle_toggle(self, message: Message) -> None:
+        """
+        Toggle playback and print the new state.
+
+        Args:
+            message (Message): The queued "toggle" message.
+        """
+        self.settings.simulationPaused = not self.settings.simulationPaused
+        print(
+            f"Simulation {f'{Fore.GREEN}un' if not self.settings.simulationPaused else Fore.YELLOW}paused{Fore.RESET}"
+        )
+
+    def _handle_pause(self, message: Message) -> None:
+        """
+        Pause playback.
+
+        Args:
+            message (Message): The queued "pause" message.
+        """
+        self.settings.simulationPaused = True
+        print(f"Simulation {Fore.YELLOW}paused{Fore.RESET}")
+
+    def _handle_play(self, message: Message) -> None:
+        """
+        Resume playback.
+
+        Args:
+            message (Message): The queued "play" message.
+        """
+        self.settings.simulationPaused = False
+        print(f"Simulation {Fore.GREEN}unpaused{Fore.RESET}")
+
+    def _handle_score(self, message: Message) -> None:
+        """
+        Print both teams' scores for the current step.
+
+        Args:
+            message (Message): The queued "score" message.
+        """
+        print(
+            f"North Score: {self.maps.north_points[self.current_map_index]}\nSouth Score: {self.maps.south_points[self.current_map_index]}"
+        )
+
+    def _handle_winner(self, message: Message) -> None:
+        """
+        Print the loaded game's winner.
+
+        Args:
+            message (Message): The queued "winner" message.
+        """
+        print(f"Winner for this game: {self.winner}")
+
+    def _step_handler(self, step: Callable[[], None]) -> Callable[[Message], None]:
+        """
+        Build a command handler that moves to another step and prints where the simulation is.
+
+        Args:
+            step (Callable[[], None]): The navigation method to call, such as `step_forward`.
+
+        Returns:
+            Callable[[Message], None]: The command handler.
+        """
+
+        def handler(message: Message) -> None:
+            step()
+            self._print_step()
+
+        return handler
+
+    def _queue_message(self, name: str) -> Callable[[list[str]], None]:
+        """
+        Build a console command callback that queues a message for the main thread.
+
+        The messages these commands queue carry no data, so a single one is created up front and queued on every use
+        instead of allocating a new one each time.
+
+        Args:
+            name (str): The message to queue, such as "toggle".
+
+        Returns:
+            Callable[[list[str]], None]: The command callback, which ignores its arguments.
+        """
+        message = Message(name)
+
+        def callback(args: list[str]) -> None:
+            self.command_queue.put(message)
+
+        return callback
+
+    def _idle_timeout(self) -> int:
+        """
+        Returns how long the main loop may wait for an event before it has work to do on its own.
+
+        While the simulation is playing, that's the time left until the next map switch; otherwise nothing happens
+        until an event or a command arrives.  Either way the wait is capped at `_IDLE_WAIT_MS`.
+
+        Returns:
+            int: The timeout in milliseconds, at least 1 since a timeout of 0 would wait forever.
+        """
+        if self.map_count and not self.settings.simulationPaused:
+            remaining = self.map_switch_interval - self.time_since_map_switch
+            return max(1, min(remaining, _IDLE_WAIT_MS))
+        return _IDLE_WAIT_MS
+
+    def _generator_running(self) -> bool:
+        """
+        Checks whether a map generator started by the generate command is still running.
+
+        Returns:
+            bool: True if the generator hasn't exited yet.
+        """
+        generator_process = self.generator_process
+        return generator_process is not None and generator_process.poll() is None
+
     def exit(self) -> None:
         """
         Save settings, clean up resources, and exit the simulation.
 
         Ensures proper shutdown of the program, including saving settings
-        and quitting Pygame.
+        and quitting Pygame.  A map generator that's still running is stopped, so it isn't left reading the terminal.
         """
         if isinstance(sys.exc_info()[1], KeyboardInterrupt):
             print()
+        # Kept in a local, since the console thread clears the attribute once the generator exits
+        generator_process = self.generator_process
+        if generator_process is not None and generator_process.poll() is None:
+            generator_process.terminate()
+            try:
+                generator_process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                generator_process.kill()
+                generator_process.wait()
         print("Quitting AntCode")
         self.settings.save()
         pygame.quit()
@@ -427,6 +815,8 @@ class AntSimulation:
                 )
 
             self.running = threading.Event()
+            # Read in every frame below
+            settings = self.settings
 
             self.console_input_thread = threading.Thread(
                 target=self.get_console_input, daemon=True
@@ -434,127 +824,77 @@ class AntSimulation:
             self.console_input_thread.start()
 
             while not self.running.is_set():
-                self.clock.tick(30)
-
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running.set()
-                        print(Style.NORMAL, end="")
-                        continue
-
-                    self.handle_mouse_event(event)
-                    self.handle_keyboard_event(event)
-                    self.handle_event(event)
-
-                while not self.command_queue.empty():
-                    message = self.command_queue.get()
-                    command = message.message
-
-                    if command == "load":
-                        self.load_maps()
-                    elif command == "generate":
-                        print(Style.NORMAL)
-                        os.system(f"{sys.executable} ./antcode/main.py")
-                    elif command == "config":
+                woken = None
+                if not self.needs_redraw and self.command_queue.empty():
+                    # The last frame is still current; sleep until there's input, a command or a step due
+                    woken = pygame.event.wait(self._idle_timeout())
+                    pygame.event.clear(_COMMAND_EVENT)
+
+                if self._sigint_handler is not None and not self._generator_running():
+                    # The map generator has exited, so Ctrl+C stops the UI again
+                    signal.signal(signal.SIGINT, self._sigint_handler)
+                    self._sigint_handler = None
+
+                # tick() returns the milliseconds since the previous frame, which is all the auto-advance needs
+                self.time_since_map_switch += self.clock.tick(30)
+
+                events = pygame.event.get()
+                if woken is not None and woken.type not in (pygame.NOEVENT, _COMMAND_EVENT):
+                    events.insert(0, woken)
+                if any(event.type == pygame.QUIT for event in events):
+                    self.running.set()
+                    print(Style.NORMAL, end="")
+                    events = [event for event in events if event.type != pygame.QUIT]
+                if events:
+                    # Mouse movement, key presses and window exposure can all change what's on screen
+                    self.needs_redraw = True
+                    if any(event.type in _EXPOSE_EVENTS for event in events):
+                        # Presenting just the hover areas would leave the rest of an uncovered window stale
+                        for component in self.components:
+                            component.dirty = True
+                self.handle_events(events)
+
+                # Settings changed by the queued commands are auto-saved once, after all of them have run
+                with self.settings.batch():
+                    for _ in range(_COMMANDS_PER_FRAME):
+                        try:
+                            message = self.command_queue.get_nowait()
+                        except Empty:
+                            break
                         try:
-                            self.settings[message.data[0]] = message.data[1]
-                            print(
-                                f"Updated {Style.DIM}'{message.data[0]}'{Style.NORMAL} to {Fore.GREEN}'{message.data[1]}'{Fore.RESET}"
-                            )
-
-                            if (
-                                message.data[0] == "cellSize"
-                                or message.data[0] == "showTopBar"
-                            ):
-                                self.reset_screen()
-                            elif message.data[0] == "stepsPerSecond":
-                                self.map_switch_interval = (
-                                    1000 // self.settings["stepsPerSecond"]
-                                )
-                        except TypeError as e:
-                            print(f"{Fore.LIGHTRED_EX}{e}{Fore.RESET}")
-                    else:
-                        if self.maps is None:
-                            print(
-                                f"{Fore.LIGHTRED_EX}No map is currently loaded{Fore.RESET}"
-                            )
-                        else:
-                            if command == "toggle":
-                                self.settings.simulationPaused = (
-                                    not self.settings.simulationPaused
-                                )
-                                print(
-                                    f"Simulation {f'{Fore.GREEN}un' if not self.settings.simulationPaused else Fore.YELLOW}paused{Fore.RESET}"
-                                )
-                            elif command == "pause":
-                                self.settings.simulationPaused = True
-                                print(f"Simulation {Fore.YELLOW}paused{Fore.RESET}")
-                            elif command == "play":
-                                self.settings.simulationPaused = False
-                                print(f"Simulation {Fore.GREEN}unpaused{Fore.RESET}")
-                            elif command == "skip-start":
-                                self.skip_start()
-                                print(
-                                    f"Step: {Fore.YELLOW if self.current_map_index + 1 == len(self.maps) else Fore.GREEN}{self.current_map_index + 1}{Fore.RESET} / {Fore.YELLOW}{len(self.maps)}{Fore.RESET}"
-                                )
-                            elif command == "step-back":
-                                self.step_backward()
-                                print(
-                                    f"Step: {Fore.YELLOW if self.current_map_index + 1 == len(self.maps) else Fore.GREEN}{self.current_map_index + 1}{Fore.RESET} / {Fore.YELLOW}{len(self.maps)}{Fore.RESET}"
-                                )
-                            elif command == "step-forward":
-                                self.step_forward()
-                                print(
-                                    f"Step: {Fore.YELLOW if self.current_map_index + 1 == len(self.maps) else Fore.GREEN}{self.current_map_index + 1}{Fore.RESET} / {Fore.YELLOW}{len(self.maps)}{Fore.RESET}"
-                                )
-                            elif command == "skip-end":
-                                self.skip_end()
-                                print(
-                                    f"Step: {Fore.YELLOW if self.current_map_index + 1 == len(self.maps) else Fore.GREEN}{self.current_map_index + 1}{Fore.RESET} / {Fore.YELLOW}{len(self.maps)}{Fore.RESET}"
-                                )
-                            elif command == "steps":
-                                print(
-                                    f"Step: {Fore.YELLOW if self.current_map_index + 1 == len(self.maps) else Fore.GREEN}{self.current_map_index + 1}{Fore.RESET} / {Fore.YELLOW}{len(self.maps)}{Fore.RESET}"
-                                )
-                            elif command == "score":
-                                print(
-                                    f"North Score: {self.maps[self.current_map_index].north_points}\nSouth Score: {self.maps[self.current_map_index].south_points}"
-                                )
-                            elif command == "winner":
-                                print(f"Winner for this game: {self.winner}")
-                    if self.command_queue.empty():
-                        self.command_queue.put(Message("CONTINUE"))
-                        break
-
-                current_time = pygame.time.get_ticks()
+                            self._handle_message(message)
+                        finally:
+                            # Once every queued message is done, the console prompts for the next command
+                            self.command_queue.task_done()
 
+                map_count = self.map_count
                 if (
-                    self.maps is not None
-                    and current_time - self.last_map_switch_time
-                    >= self.map_switch_interval
-                    and not self.settings.simulationPaused
+                    map_count
+                    and not settings.simulationPaused
+                    and self.time_since_map_switch >= self.map_switch_interval
                 ):
-                    self.last_map_switch_time = current_time
-                    self.current_map_index = (self.current_map_index + 1) % len(
-                        self.maps
-                    )
-                    self.map_component.map_data = self.maps[
-                        self.current_map_index
-                    ].board
+                    self.time_since_map_switch = 0
+                    map_index = self.current_map_index + 1
+                    if map_index >= map_count:
+                        map_index = 0
+                    self.current_map_index = map_index
+                    self.map_component.map_data = self.maps.boards[map_index]
+                    self.needs_redraw = True
 
-                    if (
-                        self.current_map_index == len(self.maps) - 1
-                        and self.settings["stopOnLastStep"]
-                    ):
-                        self.settings.simulationPaused = True
+                    if map_index == map_count - 1 and settings["stopOnLastStep"]:
+                        settings.simulationPaused = True
 
-                self.screen.fill(BLACK)
+                # While paused with no input, every frame would be identical; the window keeps showing the last one
+                if self.needs_redraw:
+                    self.needs_redraw = False
 
-                for component in self.components:
-                    component.draw(self.screen)
+                    # Components draw over what they drew last frame, so only the areas they changed are presented
+                    dirty_rects = []
+                    for component in self.components:
+                        component.draw(self.screen)
+                        dirty_rects.extend(component.get_dirty_rects())
 
-                pygame.display.flip()
-                pygame.display.update()
+                    pygame.display.update(dirty_rects)
 
             self.exit()
         except KeyboardInterrupt:
@@ -565,7 +905,7 @@ class AntSimulation:
         """
         Initialize the AntSimulation instance with settings, components, and simulation state.
         """
-        self.settings = AntSettings("settings.json")
+        self.settings = AntSettings.get("settings.json")
 
         self.running = None
 
@@ -577,7 +917,7 @@ class AntSimulation:
                 "load",
                 "Load a new game",
                 "Open an interactive file dialog where you can choose an Antcode map file.  The file will be evaluated for validity; any non-Antcode map files will be ignored.",
-                lambda args: self.command_queue.put(Message("load")),
+                self._queue_message("load"),
             )
         )
         self.command_manager.register_command(
@@ -585,7 +925,7 @@ class AntSimulation:
                 "toggle",
                 "Toggle the simulation playback state",
                 "Toggle simulation playback.  If the simulation is currently running, it will be paused, and vice versa.",
-                lambda args: self.command_queue.put(Message("toggle")),
+                self._queue_message("toggle"),
                 [""],
             )
         )
@@ -594,7 +934,7 @@ class AntSimulation:
                 "pause",
                 "Pause the simulation",
                 "Temporarily stop playback of the simulation by preventing map data from updating.  Functionality of other commands is not affected.",
-                lambda args: self.command_queue.put(Message("pause")),
+                self._queue_message("pause"),
             )
         )
         self.command_manager.register_command(
@@ -602,7 +942,7 @@ class AntSimulation:
                 "play",
                 "Unpause the simulation",
                 "Resume playback of the simulation.",
-                lambda args: self.command_queue.put(Message("play")),
+                self._queue_message("play"),
             )
         )
         self.command_manager.register_command(
@@ -610,7 +950,7 @@ class AntSimulation:
                 "skip-start",
                 "Skip to the start",
                 "Skip to the very start of the simulation, or in other words, the first step.",
-                lambda args: self.command_queue.put(Message("skip-start")),
+                self._queue_message("skip-start"),
                 ["ss", "aa"],
             )
         )
@@ -619,7 +959,7 @@ class AntSimulation:
                 "step-back",
                 "Step once backward",
                 "Decrement the step counter and update the map data.",
-                lambda args: self.command_queue.put(Message("step-back")),
+                self._queue_message("step-back"),
                 ["step-backward", "sb", "a"],
             )
         )
@@ -628,7 +968,7 @@ class AntSimulation:
                 "step-forward",
                 "Step once forward",
                 "Increment the step counter and update the map data.",
-                lambda args: self.command_queue.put(Message("step-forward")),
+                self._queue_message("step-forward"),
                 ["step-front", "step", "sf", "d", "s"],
             )
         )
@@ -637,7 +977,7 @@ class AntSimulation:
                 "skip-end",
                 "Skip to the end",
                 "Skip to the very end of the simulation, or in other words, the last step.",
-                lambda args: self.command_queue.put(Message("skip-end")),
+                self._queue_message("skip-end"),
                 ["se", "dd"],
             )
         )
@@ -646,7 +986,7 @@ class AntSimulation:
                 "steps",
                 "View current steps out of the total",
                 "Print the step number the simulation is currently on and the total number of steps in the loaded map.",
-                lambda args: self.command_queue.put(Message("steps")),
+                self._queue_message("steps"),
             )
         )
         self.command_manager.register_command(
@@ -654,7 +994,7 @@ class AntSimulation:
                 "score",
                 "View the current score for each team",
                 "Print the North and South teams' scores for the current step.",
-                lambda args: self.command_queue.put(Message("score")),
+                self._queue_message("score"),
             )
         )
         self.command_manager.register_command(
@@ -662,7 +1002,7 @@ class AntSimulation:
                 "winner",
                 "View the game's winner",
                 "Print the loaded game's winner.  This value is independent of the current step.",
-                lambda args: self.command_queue.put(Message("winner")),
+                self._queue_message("winner"),
             )
         )
         self.command_manager.register_command(
@@ -670,7 +1010,7 @@ class AntSimulation:
                 "generate",
                 "Generate a new test map",
                 "Run the original text-based Antcode simulation to generate new games and maps.",
-                lambda args: self.command_queue.put(Message("generate")),
+                self._queue_message("generate"),
                 ["gen"],
             )
         )
@@ -684,37 +1024,69 @@ class AntSimulation:
             )
         )
 
+        # Handlers for the messages the console thread queues up, looked up by message name.  The second group only
+        # applies while a map is loaded
+        self._command_handlers = {
+            "load": lambda message: self.load_maps(),
+            "generate": self._handle_generate,
+            "config": self._handle_config,
+        }
+        self._map_command_handlers = {
+            "toggle": self._handle_toggle,
+            "pause": self._handle_pause,
+            "play": self._handle_play,
+            "skip-start": self._step_handler(self.skip_start),
+            "step-back": self._step_handler(self.step_backward),
+            "step-forward": self._step_handler(self.step_forward),
+            "skip-end": self._step_handler(self.skip_end),
+            "steps": lambda message: self._print_step(),
+            "score": self._handle_score,
+            "winner": self._handle_winner,
+        }
+
         self.command_queue = Queue()
+        # The map generator started by the generate command, until it exits
+        self.generator_process: Optional[subprocess.Popen] = None
+        # The Ctrl+C handler to restore once the generator exits, while it's being ignored
+        self._sigint_handler = None
 
         self.components = []
+        self.event_components = []
+        self.mouse_components = []
+        self.keyboard_components = []
         self.current_map_index = 0
 
         self.screen_width, self.screen_height = (
-            len(BLANK_MAP[0]) * self.settings["cellSize"],
-            (len(BLANK_MAP)) * self.settings["cellSize"],
+            BLANK_MAP_SHAPE[1] * self.settings["cellSize"],
+            BLANK_MAP_SHAPE[0] * self.settings["cellSize"],
         )
         pygame.init()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed((*_HANDLED_EVENTS, _COMMAND_EVENT))
         pygame.display.set_caption("AntCode")
         try:
             pygame.display.set_icon(pygame.image.load("antcode_ui/images/icon.png"))
         except FileNotFoundError as e:
             print(f"Failed to set pygame icon: {e}")
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        # Whether the window has to be drawn and presented again at the end of the current frame
+        self.needs_redraw = True
 
         self.clock = pygame.time.Clock()
 
         self.board_size: Optional[Tuple[int, int]] = None
         self.winner: Optional[str] = None
-        self.maps: Optional[list[Round]] = None
+        self.maps: Optional[Rounds] = None
+        self.map_count = 0
         self.has_five_ants = False
 
         self.map_component = MapComponent(
-            0, 0, self.screen_width, self.screen_height, BLANK_MAP, self
+            0, 0, self.screen_width, self.screen_height, BLANK_BOARD, self
         )
         self.add_component(self.map_component)
 
         self.map_switch_interval = 1000 // self.settings["stepsPerSecond"]
-        self.last_map_switch_time = pygame.time.get_ticks()
+        self.time_since_map_switch = 0
 
     def get_console_input(self) -> None:
         """
@@ -729,26 +1101,36 @@ class AntSimulation:
         while not self.running.is_set():
             try:
                 print("--------------------------------------------------------")
-                commandList = input(f"> {Style.DIM}").lower().split(" ")
+                # The command is everything before the first space; empty input is the toggle command's alias
+                command, separator, rest = input(f"> {Style.DIM}").lower().partition(" ")
                 print(Style.NORMAL, end="")
-                command = commandList[0:1][0]
-                args = commandList[1:]
+                args = rest.split(" ") if separator else []
+
+                # Unknown commands are reported without raising and catching a KeyError for them
+                found = self.command_manager.get_command(command)
+                if found is None:
+                    print(f"Command '{command}' not found.")
+                    continue
 
                 try:
-                    if (
-                        self.command_manager.execute_command(command, args) is False
-                        or command == "help"
-                    ):
+                    if found.execute(args) is False or command == "help":
                         continue
                 except KeyError as e:
                     message = str(e)
                     print(message[1 : len(message) - 1])
                     continue
 
-                while True:
-                    cmdList = [msg.message for msg in list(self.command_queue.queue)]
-                    if cmdList == ["CONTINUE"]:
-                        self.command_queue.get()
-                        break
+                try:
+                    pygame.event.post(pygame.event.Event(_COMMAND_EVENT))
+                except pygame.error:
+                    # The display was already shut down by a quit
+                    break
+
+                # Wait for the main thread to finish the queued command, so its output comes before the next prompt
+                self.command_queue.join()
+                generator_process = self.generator_process
+                if generator_process is not None:
+                    generator_process.wait()
+                    self.generator_process = None
             except EOFError:
                 break
@@ -12,12 +12,35 @@ if platform.system() == "Linux":
         print("Wayland detected — forcing SDL to use X11 for Pygame.")
         os.environ["SDL_VIDEODRIVER"] = "x11"
 
-        try:
-            import pygame
-
-            pygame.display.init()
-            pygame.display.quit()
-        except Exception:
+        # The probe's result is kept for the rest of the login session, since XDG_RUNTIME_DIR is cleared on logout
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        driver_cache = os.path.join(runtime_dir, "antcode_ui_sdl_driver") if runtime_dir else None
+        cached_driver = None
+        if driver_cache:
+            try:
+                with open(driver_cache) as file:
+                    cached_driver = file.read().strip()
+            except OSError:
+                pass
+
+        if cached_driver not in ("x11", "wayland"):
+            try:
+                import pygame
+
+                pygame.display.init()
+                pygame.display.quit()
+                cached_driver = "x11"
+            except Exception:
+                cached_driver = "wayland"
+
+            if driver_cache:
+                try:
+                    with open(driver_cache, "w") as file:
+                        file.write(cached_driver)
+                except OSError:
+                    pass
+
+        if cached_driver == "wayland":
             print("X11 unavailable — falling back to Wayland.")
             os.environ.pop("SDL_VIDEODRIVER", None)
 